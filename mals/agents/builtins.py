@@ -20,10 +20,21 @@ from typing import Any
 from mals.agents.registry import AgentSpec, specialist
 from mals.core.blackboard import Blackboard
 from mals.core.models import ConsensusStatus
-from mals.llm.client import LLMClient
+from mals.llm.client import LLMClient, json_schema_format
 
 logger = logging.getLogger("mals.agents.builtins")
 
+# Structured-output schema for the critic's review verdict
+CONSENSUS_VERDICT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "verdict": {"type": "string", "enum": ["APPROVED", "REJECTED"]},
+        "critique": {"type": "string"},
+    },
+    "required": ["verdict", "critique"],
+    "additionalProperties": False,
+}
+
 
 def create_builtin_agents(llm_client: LLMClient) -> list[AgentSpec]:
     """
@@ -156,6 +167,7 @@ def create_builtin_agents(llm_client: LLMClient) -> list[AgentSpec]:
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             max_tokens=800,
+            response_format=json_schema_format("consensus_verdict", CONSENSUS_VERDICT_SCHEMA),
         )
 
         try:
@@ -34,7 +34,7 @@ logger = logging.getLogger("mals.agents")
 AgentExecuteFn = Callable[[dict[str, Any], Blackboard], Coroutine[Any, Any, dict[str, Any]]]
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentSpec:
     """Specification for a specialist agent."""
     name: str
@@ -103,6 +103,8 @@ class AgentRegistry:
 
     def __init__(self) -> None:
         self._agents: dict[str, AgentSpec] = {}
+        # describe_all() output, rebuilt after the next registration
+        self._description: str | None = None
 
     def register(self, agent: AgentSpec) -> None:
         """
@@ -114,9 +116,13 @@ class AgentRegistry:
         Raises:
             ValueError: If an agent with the same name is already registered.
         """
-        if agent.name in self._agents:
+        # One hash lookup for both the duplicate check and the insert. The
+        # size check (not identity) also rejects re-registering the same spec.
+        count = len(self._agents)
+        self._agents.setdefault(agent.name, agent)
+        if len(self._agents) == count:
             raise ValueError(f"Agent '{agent.name}' is already registered.")
-        self._agents[agent.name] = agent
+        self._description = None
         logger.info("Registered agent: %s — %s", agent.name, agent.description)
 
     def get(self, name: str) -> AgentSpec | None:
@@ -132,19 +138,25 @@ class AgentRegistry:
         Generate a human-readable description of all registered agents.
 
         This is injected into the Conductor's system prompt so it knows
-        which agents are available and what they do.
+        which agents are available and what they do. The text is built once
+        and reused until another agent is registered.
         """
+        if self._description is None:
+            self._description = self._build_description()
+        return self._description
+
+    def _build_description(self) -> str:
         if not self._agents:
             return "(No agents registered)"
 
         lines: list[str] = []
+        append = lines.append
         for agent in self._agents.values():
-            parts = [f"- **{agent.name}**: {agent.description}"]
+            append(f"- **{agent.name}**: {agent.description}")
             if agent.input_fields:
-                parts.append(f"  Reads: {', '.join(agent.input_fields)}")
+                append(f"  Reads: {', '.join(agent.input_fields)}")
             if agent.output_fields:
-                parts.append(f"  Writes: {', '.join(agent.output_fields)}")
-            lines.extend(parts)
+                append(f"  Writes: {', '.join(agent.output_fields)}")
         return "\n".join(lines)
 
     def __len__(self) -> int:
@@ -57,10 +57,10 @@ class InMemoryBackend(BlackboardBackend):
     """In-memory storage backend. Data is lost when the process exits."""
 
     def __init__(self) -> None:
-        self._store: dict[str, str] = {}
+        self._store: dict[str, bytes] = {}
 
     def save(self, state: BlackboardState) -> None:
-        self._store[state.task_id] = state.model_dump_json()
+        self._store[state.task_id] = state.to_wire()
 
     def load(self, task_id: str) -> BlackboardState | None:
         raw = self._store.get(task_id)
@@ -89,7 +89,7 @@ class RedisBackend(BlackboardBackend):
 
     def save(self, state: BlackboardState) -> None:
         key = f"{self.KEY_PREFIX}{state.task_id}"
-        self._client.set(key, state.model_dump_json())
+        self._client.set(key, state.to_wire())
 
     def load(self, task_id: str) -> BlackboardState | None:
         key = f"{self.KEY_PREFIX}{task_id}"
@@ -190,8 +190,9 @@ class Blackboard:
             reason: Human-readable reason for the transition.
         """
         old_status = self.state.global_status
+        # Records built here from trusted in-process values skip re-validation
         self.state.status_history.append(
-            StatusChange(
+            StatusChange.model_construct(
                 from_status=old_status.value,
                 to_status=new_status.value,
                 reason=reason,
@@ -217,6 +218,7 @@ class Blackboard:
         and the field is automatically marked as "hot" in memory.
         """
         self.state.workspace[field] = value
+        self.state.invalidate_workspace_text(field)
         if field not in self.state.memory.hot:
             self.state.memory.hot.append(field)
         self._persist()
@@ -225,6 +227,7 @@ class Blackboard:
     def delete_workspace(self, field: str) -> None:
         """Remove a field from the workspace."""
         self.state.workspace.pop(field, None)
+        self.state.invalidate_workspace_text(field)
         if field in self.state.memory.hot:
             self.state.memory.hot.remove(field)
         self._persist()
@@ -235,6 +238,7 @@ class Blackboard:
 
     def propose_hypothesis(self, content: str, author_agent: str) -> Hypothesis:
         """Add a new hypothesis to the thread."""
+        # Validated: content and author come from agents and LLM output
         h = Hypothesis(content=content, author_agent=author_agent)
         self.state.hypothesis_thread.append(h)
         self._persist()
@@ -329,7 +333,8 @@ class Blackboard:
 
     def log_invocation_start(self, agent_name: str) -> AgentInvocationRecord:
         """Record the start of an agent invocation."""
-        record = AgentInvocationRecord(agent_name=agent_name)
+        # Trusted: the name has already been resolved against the agent registry
+        record = AgentInvocationRecord.model_construct(agent_name=agent_name)
         self.state.invocation_log.append(record)
         self._persist()
         return record
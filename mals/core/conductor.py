@@ -11,12 +11,12 @@ The Conductor never performs domain work itself. It is purely a router and sched
 
 from __future__ import annotations
 
-import json
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
 from mals.core.models import ConsensusStatus, GlobalStatus
+from mals.llm.client import LLMUsage, json_schema_format, parse_json_content
 
 if TYPE_CHECKING:
     from mals.agents.registry import AgentRegistry
@@ -99,6 +99,23 @@ You MUST respond with a valid JSON object (no markdown, no explanation):
 }}
 """
 
+# JSON schema for the Think step, sent as a strict structured-output format
+CONDUCTOR_ACTION_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "action": {
+            "type": "string",
+            "enum": ["invoke_agent", "update_status", "complete", "fail"],
+        },
+        "agent_name": {"type": ["string", "null"]},
+        "relevant_fields": {"type": "array", "items": {"type": "string"}},
+        "include_consensus": {"type": "boolean"},
+        "reason": {"type": "string"},
+    },
+    "required": ["action", "agent_name", "relevant_fields", "include_consensus", "reason"],
+    "additionalProperties": False,
+}
+
 
 class Conductor:
     """
@@ -118,12 +135,14 @@ class Conductor:
         max_steps: int = 50,
         metrics: "MetricsCollector | None" = None,
         recorder: "EventRecorder | None" = None,
+        context_chars_per_field: int | None = 4000,
     ) -> None:
         self._board = blackboard
         self._llm = llm_client
         self._memory = memory_manager
         self._registry = agent_registry
         self._max_steps = max_steps
+        self._context_chars_per_field = context_chars_per_field
         self._step_count = 0
         self._metrics = metrics
         self._recorder = recorder
@@ -168,7 +187,7 @@ class Conductor:
 
             # THINK: Ask LLM for routing decision
             think_start = time.time()
-            decision = await self._think(dashboard)
+            decision, think_usage = await self._think(dashboard)
             think_latency = time.time() - think_start
             logger.info("Decision: %s", decision)
 
@@ -184,8 +203,8 @@ class Conductor:
                     action=decision.action,
                     agent_name=decision.agent_name,
                     latency=think_latency,
-                    input_tokens=self._llm.total_usage.input_tokens,
-                    output_tokens=self._llm.total_usage.output_tokens,
+                    input_tokens=think_usage.input_tokens,
+                    output_tokens=think_usage.output_tokens,
                 )
 
             # ACT: Execute the decision
@@ -217,8 +236,14 @@ class Conductor:
     _last_agent: str | None = None
     _repeat_count: int = 0
 
-    async def _think(self, dashboard: str) -> ConductorDecision:
-        """Use the LLM to decide the next action based on the dashboard view."""
+    async def _think(self, dashboard: str) -> tuple[ConductorDecision, LLMUsage]:
+        """
+        Use the LLM to decide the next action based on the dashboard view.
+
+        Returns the decision and the token usage of this Think call alone;
+        the LLM client may be shared with concurrent tasks. The usage is kept
+        even when the reply fails to parse, since its tokens were spent.
+        """
         agent_descriptions = self._registry.describe_all()
         system_prompt = CONDUCTOR_SYSTEM_PROMPT.format(agent_descriptions=agent_descriptions)
 
@@ -253,29 +278,35 @@ class Conductor:
         hint_block = "\n".join(hints)
         user_prompt = f"Current blackboard state:\n\n{dashboard}\n\n{hint_block}\n\nWhat should be the next action?"
 
+        usage = LLMUsage()
         try:
-            raw_response = await self._llm.complete(
+            resp = await self._llm.complete_with_usage(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 max_tokens=300,
                 temperature=0.1,
+                response_format=json_schema_format("conductor_action", CONDUCTOR_ACTION_SCHEMA),
             )
-
-            # Parse the JSON response
-            decision_data = _parse_json_response(raw_response)
-            return ConductorDecision(
+            usage = LLMUsage(
+                input_tokens=resp.input_tokens,
+                output_tokens=resp.output_tokens,
+                total_tokens=resp.total_tokens,
+            )
+            decision_data = parse_json_content(resp.content)
+            decision = ConductorDecision(
                 action=decision_data.get("action", "fail"),
                 agent_name=decision_data.get("agent_name"),
                 relevant_fields=decision_data.get("relevant_fields", []),
                 include_consensus=decision_data.get("include_consensus", False),
                 reason=decision_data.get("reason", ""),
             )
+            return decision, usage
 
         except Exception as e:
             logger.error("Conductor think step failed: %s", e)
             if self._recorder:
                 self._recorder.record_error("conductor_think", str(e))
-            return ConductorDecision(action="fail", reason=f"Conductor error: {e}")
+            return ConductorDecision(action="fail", reason=f"Conductor error: {e}"), usage
 
     # ------------------------------------------------------------------
     # ACT — Execute the routing decision
@@ -366,6 +397,7 @@ class Conductor:
             relevant_fields=decision.relevant_fields,
             include_hypotheses=True,
             include_consensus=decision.include_consensus,
+            max_chars_per_field=self._context_chars_per_field,
         )
 
         # Log invocation start
@@ -478,19 +510,3 @@ class Conductor:
         """Return the current step count."""
         return self._step_count
 
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _parse_json_response(raw: str) -> dict[str, Any]:
-    """Extract a JSON object from an LLM response, handling markdown fences."""
-    text = raw.strip()
-    # Remove markdown code fences if present
-    if text.startswith("```"):
-        lines = text.split("\n")
-        # Remove first and last lines (fences)
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines).strip()
-
-    return json.loads(text)
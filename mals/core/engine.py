@@ -65,12 +65,12 @@ class MALSEngine:
         if self._config.llm.base_url:
             llm_kwargs["base_url"] = self._config.llm.base_url
 
-        self._agent_llm = LLMClient(
+        self._agent_llm = LLMClient.get_or_create(
             model=self._config.llm.model,
             temperature=self._config.llm.temperature,
             **llm_kwargs,
         )
-        self._conductor_llm = LLMClient(
+        self._conductor_llm = LLMClient.get_or_create(
             model=self._config.llm.conductor_model,
             temperature=0.1,  # Conductor should be deterministic
             **llm_kwargs,
@@ -134,10 +134,6 @@ class MALSEngine:
         self._metrics = MetricsCollector()
         self._recorder = EventRecorder() if record else None
 
-        # Reset LLM usage counters
-        self._agent_llm.reset_usage()
-        self._conductor_llm.reset_usage()
-
         # Initialize blackboard
         state = self._blackboard.initialize(objective, constraints)
         logger.info("Task started: %s (id=%s)", objective, state.task_id)
@@ -151,6 +147,7 @@ class MALSEngine:
             max_steps=max_steps or self._config.conductor.max_steps,
             metrics=self._metrics,
             recorder=self._recorder,
+            context_chars_per_field=self._config.conductor.context_chars_per_field,
         )
 
         final_status = await conductor.run()
@@ -162,20 +159,8 @@ class MALSEngine:
             "objective": objective,
             "workspace": dict(self._blackboard.state.workspace),
             "steps": conductor.step_count,
-            "token_usage": {
-                "conductor": {
-                    "input": self._conductor_llm.total_usage.input_tokens,
-                    "output": self._conductor_llm.total_usage.output_tokens,
-                },
-                "agents": {
-                    "input": self._agent_llm.total_usage.input_tokens,
-                    "output": self._agent_llm.total_usage.output_tokens,
-                },
-                "total": (
-                    self._conductor_llm.total_usage.total_tokens
-                    + self._agent_llm.total_usage.total_tokens
-                ),
-            },
+            # Summed per call: the LLM clients may be shared with concurrent runs
+            "token_usage": self._metrics.token_usage(),
             "metrics": self._metrics.to_dict() if self._metrics else {},
         }
 
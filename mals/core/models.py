@@ -8,12 +8,13 @@ All models use Pydantic v2 for strict validation and serialization.
 
 from __future__ import annotations
 
+import json
 import time
 import uuid
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 # ---------------------------------------------------------------------------
@@ -154,6 +155,43 @@ class BlackboardState(BaseModel):
     # -- Conductor scratch-pad (lightweight notes for the conductor) --
     conductor_notes: str = ""
 
+    # -- Cached JSON text of non-string workspace values (not persisted) --
+    _workspace_repr: dict[str, tuple[Any, str]] = PrivateAttr(default_factory=dict)
+
     def touch(self) -> None:
-        """Update the `updated_at` timestamp."""
+        """Update the `updated_at` timestamp and drop cached workspace text."""
         self.updated_at = time.time()
+        self._workspace_repr.clear()
+
+    def workspace_text(self, field: str) -> str:
+        """
+        Return a workspace value as text, JSON-encoding non-string values.
+
+        The encoding is cached per field until the field is rebound or the
+        state is next touched, so repeated lookups of a large dict/list
+        artifact between writes pay for `json.dumps` only once. A value
+        mutated in place is re-encoded after the next blackboard write.
+        """
+        value = self.workspace.get(field)
+        if isinstance(value, str):
+            return value
+        cached = self._workspace_repr.get(field)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        text = json.dumps(value, ensure_ascii=False)
+        self._workspace_repr[field] = (value, text)
+        return text
+
+    def invalidate_workspace_text(self, field: str) -> None:
+        """Drop the cached text for a field after it has been written or removed."""
+        self._workspace_repr.pop(field, None)
+
+    def to_wire(self) -> bytes:
+        """
+        Serialize the state to UTF-8 JSON bytes for persistence.
+
+        Calls the pydantic-core serializer directly, skipping the bytes -> str
+        decode that `model_dump_json()` performs. Restore with
+        `BlackboardState.model_validate_json()`, which accepts bytes.
+        """
+        return self.__pydantic_serializer__.to_json(self)
@@ -15,12 +15,31 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
+import threading
 from dataclasses import dataclass
+from typing import Any
 
 logger = logging.getLogger("mals.llm")
 
+# Process-wide client cache used by LLMClient.get_or_create()
+_CLIENTS: dict[tuple[Any, ...], LLMClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Fallback for providers that reject `json_schema` structured outputs.
+_JSON_OBJECT_FORMAT: dict[str, Any] = {"type": "json_object"}
+
+
+def json_schema_format(name: str, schema: dict[str, Any]) -> dict[str, Any]:
+    """Build a strict `json_schema` response_format for structured outputs."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "schema": schema, "strict": True},
+    }
+
 
 @dataclass
 class LLMUsage:
@@ -75,12 +94,52 @@ class LLMClient:
         if base_url:
             client_kwargs["base_url"] = base_url
 
+        self._client_cls = AsyncOpenAI
+        self._client_kwargs = client_kwargs
         self._client = AsyncOpenAI(**client_kwargs)
+        # The HTTP connection pool is bound to the event loop it is first used
+        # on; `_client_for_running_loop` rebuilds the client when that changes.
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._client_lock = threading.Lock()
+        self._supports_json_schema = True
         self._total_usage = LLMUsage()
         self._last_usage = LLMUsage()
 
         logger.info("LLMClient initialized: model=%s", self.model)
 
+    @classmethod
+    def get_or_create(
+        cls,
+        model: str | None = None,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        temperature: float = 0.3,
+        max_retries: int = 3,
+    ) -> LLMClient:
+        """
+        Return a shared client for these settings, creating it on first use.
+
+        Reusing clients across engines avoids rebuilding the AsyncOpenAI
+        client and its HTTP connection pool per engine. The pool follows the
+        running event loop, so share a client only between engines driven
+        from one loop at a time. Shared clients accumulate usage from every
+        caller, so per-task usage must be summed from the `LLMResponse` of
+        each call rather than read from `total_usage`.
+        """
+        key = (model, api_key, base_url, temperature, max_retries)
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = cls(
+                    model=model,
+                    api_key=api_key,
+                    base_url=base_url,
+                    temperature=temperature,
+                    max_retries=max_retries,
+                )
+                _CLIENTS[key] = client
+        return client
+
     async def complete(
         self,
         system_prompt: str,
@@ -111,6 +170,7 @@ class LLMClient:
         model: str | None = None,
         max_tokens: int = 2000,
         temperature: float | None = None,
+        response_format: dict[str, Any] | None = None,
     ) -> LLMResponse:
         """
         Send a completion request and return both content and token usage.
@@ -121,6 +181,10 @@ class LLMClient:
             model: Override the default model for this call.
             max_tokens: Maximum tokens in the response.
             temperature: Override the default temperature for this call.
+            response_format: Optional OpenAI `response_format` (e.g. from
+                `json_schema_format()`). If the provider rejects a `json_schema`
+                format, the call is retried once in `json_object` mode and the
+                client uses `json_object` from then on.
 
         Returns:
             An LLMResponse with content and per-call token usage.
@@ -129,14 +193,20 @@ class LLMClient:
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ]
+        request: dict[str, Any] = {
+            "model": model or self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature if temperature is not None else self.default_temperature,
+        }
+        wants_schema = response_format is not None and response_format.get("type") == "json_schema"
+        if wants_schema and not self._supports_json_schema:
+            response_format = _JSON_OBJECT_FORMAT
+        if response_format is not None:
+            request["response_format"] = response_format
 
         try:
-            response = await self._client.chat.completions.create(
-                model=model or self.model,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature if temperature is not None else self.default_temperature,
-            )
+            response = await self._create(request, wants_schema)
 
             input_tok = response.usage.prompt_tokens if response.usage else 0
             output_tok = response.usage.completion_tokens if response.usage else 0
@@ -155,10 +225,11 @@ class LLMClient:
             )
 
             content = response.choices[0].message.content or ""
-            logger.debug(
-                "LLM call: model=%s, input=%d, output=%d tokens",
-                model or self.model, input_tok, output_tok,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "LLM call: model=%s, input=%d, output=%d tokens",
+                    model or self.model, input_tok, output_tok,
+                )
             return LLMResponse(
                 content=content,
                 input_tokens=input_tok,
@@ -170,6 +241,104 @@ class LLMClient:
             logger.error("LLM call failed: %s", e)
             raise
 
+    async def _create(self, request: dict[str, Any], wants_schema: bool) -> Any:
+        """Issue a chat completion, downgrading `json_schema` to `json_object` if rejected."""
+        client = await self._client_for_running_loop()
+        try:
+            return await client.chat.completions.create(**request)
+        except Exception as e:
+            if not (wants_schema and self._supports_json_schema and _rejects_response_format(e)):
+                raise
+            logger.warning(
+                "json_schema response_format rejected (%s); falling back to json_object", e
+            )
+            self._supports_json_schema = False
+            request["response_format"] = _JSON_OBJECT_FORMAT
+            return await client.chat.completions.create(**request)
+
+    async def _client_for_running_loop(self) -> Any:
+        """
+        Return the AsyncOpenAI instance bound to the running event loop.
+
+        When calls move to another loop (e.g. successive `asyncio.run()`
+        calls), the client is rebuilt and the old one closed so its pooled
+        sockets are released rather than kept alive with the dead loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._client_lock:
+            if self._client_loop is loop:
+                return self._client
+            stale = self._client if self._client_loop is not None else None
+            if stale is not None:
+                self._client = self._client_cls(**self._client_kwargs)
+            self._client_loop = loop
+            client = self._client
+        if stale is not None:
+            try:
+                await stale.close()
+            except Exception as e:
+                # Connections opened on a closed loop still drop their sockets,
+                # but the transport then fails to reach that loop
+                logger.debug("Closing the previous loop's HTTP client: %s", e)
+        return client
+
+    async def complete_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema: dict[str, Any],
+        schema_name: str = "response",
+        model: str | None = None,
+        max_tokens: int = 2000,
+        temperature: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Send a completion request constrained to a JSON schema.
+
+        The schema is passed as a strict `json_schema` response_format so the
+        server only returns schema-valid JSON, which removes the need for
+        re-parsing or retrying malformed output.
+
+        Returns:
+            The parsed JSON object.
+        """
+        data, _ = await self.complete_json_with_usage(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            schema=schema,
+            schema_name=schema_name,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        return data
+
+    async def complete_json_with_usage(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema: dict[str, Any],
+        schema_name: str = "response",
+        model: str | None = None,
+        max_tokens: int = 2000,
+        temperature: float | None = None,
+    ) -> tuple[dict[str, Any], LLMResponse]:
+        """
+        Like `complete_json()`, but also return the call's `LLMResponse`.
+
+        Returns:
+            The parsed JSON object and the response carrying its token usage.
+        """
+        resp = await self.complete_with_usage(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            response_format=json_schema_format(schema_name, schema),
+        )
+        return parse_json_content(resp.content), resp
+
     @property
     def total_usage(self) -> LLMUsage:
         """Return cumulative token usage across all calls."""
@@ -178,3 +347,26 @@ class LLMClient:
     def reset_usage(self) -> None:
         """Reset the cumulative token usage counter."""
         self._total_usage = LLMUsage()
+
+
+def _rejects_response_format(error: Exception) -> bool:
+    """
+    Whether an API error says the `json_schema` response_format is unsupported.
+
+    Providers without structured-output support answer with HTTP 400 naming
+    the parameter. Other 400s (bad prompt, context length) must not disable
+    structured outputs, so the error body has to mention it.
+    """
+    if getattr(error, "status_code", None) != 400:
+        return False
+    text = f"{error} {getattr(error, 'body', '')}".lower()
+    return "response_format" in text or "json_schema" in text
+
+
+def parse_json_content(raw: str) -> dict[str, Any]:
+    """Parse a JSON object from LLM output, tolerating markdown code fences."""
+    text = raw.strip()
+    if text.startswith("```"):
+        lines = [line for line in text.split("\n") if not line.strip().startswith("```")]
+        text = "\n".join(lines).strip()
+    return json.loads(text)
@@ -12,16 +12,22 @@ This module should be invoked after every agent write-back to keep memory lean.
 
 from __future__ import annotations
 
-import json
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+from mals.core.models import HypothesisStatus
+
 if TYPE_CHECKING:
     from mals.core.models import BlackboardState
     from mals.llm.client import LLMClient
 
 logger = logging.getLogger("mals.memory")
 
+# Enum members are singletons, so hot-path status checks compare by identity
+_PROPOSED = HypothesisStatus.PROPOSED
+_PROPOSED_VALUE = _PROPOSED.value
+
 
 class MemoryManager:
     """Manages the three-tier memory lifecycle on the blackboard."""
@@ -66,17 +72,15 @@ class MemoryManager:
 
             # Workspace content summary (one line per field, excluding plan)
             lines.append("Workspace content:")
+            warm = state.memory.warm
             for key, value in state.workspace.items():
                 if key == "plan":
                     continue  # Already shown above
-                if key in state.memory.warm:
-                    lines.append(f"  {key}: [completed] {state.memory.warm[key]}")
-                elif isinstance(value, str) and len(value) > 200:
-                    lines.append(f"  {key}: {value[:120]}... ({len(value)} chars)")
-                elif isinstance(value, dict):
-                    lines.append(f"  {key}: {json.dumps(value, ensure_ascii=False)[:120]}")
+                if key in warm:
+                    lines.append(f"  {key}: [completed] {warm[key]}")
                 else:
-                    lines.append(f"  {key}: {value}")
+                    render = _VALUE_RENDERERS.get(type(value), _render_any)
+                    lines.append(f"  {key}: {render(state, key, value)}")
         else:
             lines.append("Workspace fields present: [] (empty)")
 
@@ -94,7 +98,7 @@ class MemoryManager:
             lines.append("Consensus: none active")
 
         # Active hypotheses (only proposed ones)
-        proposed = [h for h in state.hypothesis_thread if h.status.value == "proposed"]
+        proposed = [h for h in state.hypothesis_thread if h.status is _PROPOSED]
         if proposed:
             lines.append(f"Open hypotheses ({len(proposed)}):")
             for h in proposed[-3:]:
@@ -120,6 +124,8 @@ class MemoryManager:
         relevant_fields: list[str],
         include_hypotheses: bool = False,
         include_consensus: bool = False,
+        max_chars_per_field: int | None = None,
+        include_summaries: bool = False,
     ) -> dict[str, Any]:
         """
         Extract a minimal context slice from the blackboard for a specialist agent.
@@ -132,6 +138,12 @@ class MemoryManager:
             relevant_fields: List of workspace field names the agent needs.
             include_hypotheses: Whether to include the hypothesis thread.
             include_consensus: Whether to include the consensus state.
+            max_chars_per_field: Optional size budget for string workspace values.
+                Longer strings are replaced by a head/tail excerpt; structured
+                values (such as the plan) are always passed as-is. The artifact
+                under consensus review is always passed in full.
+            include_summaries: Also pass the warm summary, as ``<field>_summary``,
+                for fields that have already been compressed.
 
         Returns:
             A dictionary containing only the relevant information.
@@ -142,18 +154,39 @@ class MemoryManager:
             "workspace": {},
         }
 
+        # The artifact under review must reach the critic/reviser untruncated
+        review_target = (
+            state.consensus.target_field if include_consensus and state.consensus else None
+        )
+        warm = state.memory.warm
+
         # Extract only requested workspace fields
         for field in relevant_fields:
             if field in state.workspace:
-                context["workspace"][field] = state.workspace[field]
-            elif field in state.memory.warm:
-                context["workspace"][f"{field}_summary"] = state.memory.warm[field]
+                value = state.workspace[field]
+                if (
+                    max_chars_per_field is not None
+                    and field != review_target
+                    and isinstance(value, str)
+                    and len(value) > max_chars_per_field
+                ):
+                    value = _elide(value, max_chars_per_field)
+                context["workspace"][field] = value
+                if include_summaries and field in warm:
+                    context["workspace"][f"{field}_summary"] = warm[field]
+            elif field in warm:
+                context["workspace"][f"{field}_summary"] = warm[field]
 
         if include_hypotheses:
             context["hypotheses"] = [
-                {"id": h.id, "content": h.content, "status": h.status.value, "author": h.author_agent}
+                {
+                    "id": h.id,
+                    "content": h.content,
+                    "status": _PROPOSED_VALUE,
+                    "author": h.author_agent,
+                }
                 for h in state.hypothesis_thread
-                if h.status.value == "proposed"
+                if h.status is _PROPOSED
             ]
 
         if include_consensus and state.consensus:
@@ -192,8 +225,7 @@ class MemoryManager:
         if field_name not in state.workspace:
             return ""
 
-        content = state.workspace[field_name]
-        content_str = json.dumps(content, ensure_ascii=False) if not isinstance(content, str) else content
+        content_str = state.workspace_text(field_name)
 
         if self._llm and len(content_str) > 500:
             # Use LLM to generate an intelligent summary
@@ -224,3 +256,40 @@ class MemoryManager:
     def get_hot_fields(self, state: "BlackboardState") -> list[str]:
         """Return the list of currently hot workspace fields."""
         return list(state.memory.hot)
+
+
+def _elide(text: str, max_chars: int) -> str:
+    """Return a head/tail excerpt of a string that is over budget."""
+    half = max_chars // 2
+    return f"{text[:half]}\n…[{len(text) - 2 * half} chars elided]…\n{text[-half:]}"
+
+
+# ---------------------------------------------------------------------------
+# Dashboard value renderers
+# ---------------------------------------------------------------------------
+# Workspace values are almost always exact str or dict instances, so the
+# dashboard dispatches on type(value) with one dict lookup and only falls back
+# to the isinstance chain for subclasses and other types.
+
+def _render_str(state: BlackboardState, key: str, value: str) -> str:
+    if len(value) > 200:
+        return f"{value[:120]}... ({len(value)} chars)"
+    return value
+
+
+def _render_dict(state: BlackboardState, key: str, value: dict[str, Any]) -> str:
+    return state.workspace_text(key)[:120]
+
+
+def _render_any(state: BlackboardState, key: str, value: Any) -> str:
+    if isinstance(value, str):
+        return _render_str(state, key, value)
+    if isinstance(value, dict):
+        return _render_dict(state, key, value)
+    return f"{value}"
+
+
+_VALUE_RENDERERS: dict[type, Callable[[BlackboardState, str, Any], str]] = {
+    str: _render_str,
+    dict: _render_dict,
+}
@@ -3,9 +3,14 @@ MALS Dashboard — A lightweight web-based visualization for task replay and met
 
 Provides a single-file FastAPI server that serves:
 - /              → Dashboard HTML page (embedded, no external dependencies)
+- /api/snapshot  → Everything the page needs in one payload: metrics, charts,
+                   recording metadata and the summarized timeline
 - /api/metrics   → Current metrics as JSON
+- /api/charts    → Chart-ready columnar arrays derived from the metrics
 - /api/recording → Event recording as JSON
-- /api/timeline  → Simplified timeline for visualization
+- /api/recording/stream → Event recording as NDJSON (metadata line, then one event per line)
+- /api/timeline  → Simplified timeline for visualization (pre-rendered summaries)
+- /api/timeline/full → Timeline including each event's raw data
 
 The dashboard uses vanilla HTML/CSS/JS with Chart.js (loaded from CDN) for
 visualization. No build step required.
@@ -22,10 +27,23 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import gzip
+import hashlib
 import logging
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
+
+from mals.observability.recorder import summarize_event
+from mals.utils.serialization import dumps, loads
+
+try:
+    from fastapi import FastAPI, Header, Response
+    from fastapi.responses import StreamingResponse
+except ImportError:
+    _FASTAPI_AVAILABLE = False
+else:
+    _FASTAPI_AVAILABLE = True
 
 logger = logging.getLogger("mals.observability.dashboard")
 
@@ -41,55 +59,221 @@ def create_dashboard_app(
 
     Can accept data directly (from a live run) or file paths (for replay).
     """
-    try:
-        from fastapi import FastAPI
-        from fastapi.responses import HTMLResponse, JSONResponse
-    except ImportError as e:
+    if not _FASTAPI_AVAILABLE:
         raise ImportError(
             "Dashboard requires 'fastapi' and 'uvicorn'. "
             "Install with: pip install fastapi uvicorn"
-        ) from e
+        )
 
     # Load from files if paths are provided
     if metrics_file and not metrics_data:
-        with open(metrics_file, encoding="utf-8") as f:
-            metrics_data = json.load(f)
+        metrics_data = loads(Path(metrics_file).read_bytes())
     if recording_file and not recording_data:
-        with open(recording_file, encoding="utf-8") as f:
-            recording_data = json.load(f)
+        recording_data = loads(Path(recording_file).read_bytes())
+
+    # The data is fixed for the app's lifetime, so every payload is encoded,
+    # gzipped and hashed once; polls with a matching If-None-Match get a 304
+    charts = _build_chart_columns(metrics_data)
+    timeline = _build_timeline(recording_data)
+    snapshot_payload = _encode_body(dumps({
+        "metrics": metrics_data or {},
+        "charts": charts,
+        "recording": _recording_meta(recording_data),
+        "timeline": timeline,
+    }))
+    metrics_payload = _encode_body(dumps(metrics_data or {}))
+    charts_payload = _encode_body(dumps(charts))
+    recording_payload = _encode_body(dumps(recording_data or {}))
+    timeline_payload = _encode_body(dumps(timeline))
+    timeline_full_payload = _encode_body(dumps(_build_timeline(recording_data, include_data=True)))
+
+    def send(
+        payload: _EncodedBody,
+        media_type: str,
+        cache_control: str,
+        accept_encoding: str | None,
+        if_none_match: str | None,
+    ) -> Response:
+        headers = {"cache-control": cache_control, "vary": "Accept-Encoding"}
+        body, etag = payload.body, payload.etag
+        use_gzip = payload.gzipped is not None and "gzip" in (accept_encoding or "")
+        if use_gzip:
+            body, etag = payload.gzipped, payload.gzip_etag
+        headers["etag"] = etag
+        if if_none_match == etag:
+            return Response(status_code=304, headers=headers)
+        if use_gzip:
+            headers["content-encoding"] = "gzip"
+        return Response(content=body, media_type=media_type, headers=headers)
+
+    def send_json(
+        payload: _EncodedBody, accept_encoding: str | None, if_none_match: str | None
+    ) -> Response:
+        return send(payload, "application/json", "no-cache", accept_encoding, if_none_match)
 
     app = FastAPI(title="MALS Dashboard", version="0.2.0")
 
-    @app.get("/", response_class=HTMLResponse)
-    async def index():
-        return _dashboard_html()
-
-    @app.get("/api/metrics", response_class=JSONResponse)
-    async def get_metrics():
-        return metrics_data or {}
-
-    @app.get("/api/recording", response_class=JSONResponse)
-    async def get_recording():
-        return recording_data or {}
-
-    @app.get("/api/timeline", response_class=JSONResponse)
-    async def get_timeline():
-        if not recording_data:
-            return []
-        events = recording_data.get("events", [])
-        timeline = []
-        for e in events:
-            timeline.append({
-                "step": e.get("step", 0),
-                "timestamp": e.get("timestamp", 0),
-                "type": e.get("type", ""),
-                "data": e.get("data", {}),
-            })
-        return timeline
+    @app.get("/")
+    async def index(
+        accept_encoding: str | None = Header(default=None),
+        if_none_match: str | None = Header(default=None),
+    ):
+        return send(
+            _DASHBOARD_PAGE,
+            "text/html; charset=utf-8",
+            "public, max-age=3600",
+            accept_encoding,
+            if_none_match,
+        )
+
+    @app.get("/api/snapshot")
+    async def get_snapshot(
+        accept_encoding: str | None = Header(default=None),
+        if_none_match: str | None = Header(default=None),
+    ):
+        return send_json(snapshot_payload, accept_encoding, if_none_match)
+
+    @app.get("/api/metrics")
+    async def get_metrics(
+        accept_encoding: str | None = Header(default=None),
+        if_none_match: str | None = Header(default=None),
+    ):
+        return send_json(metrics_payload, accept_encoding, if_none_match)
+
+    @app.get("/api/charts")
+    async def get_charts(
+        accept_encoding: str | None = Header(default=None),
+        if_none_match: str | None = Header(default=None),
+    ):
+        return send_json(charts_payload, accept_encoding, if_none_match)
+
+    @app.get("/api/recording")
+    async def get_recording(
+        accept_encoding: str | None = Header(default=None),
+        if_none_match: str | None = Header(default=None),
+    ):
+        return send_json(recording_payload, accept_encoding, if_none_match)
+
+    @app.get("/api/recording/stream")
+    async def stream_recording():
+        return StreamingResponse(
+            _iter_recording_ndjson(recording_data),
+            media_type="application/x-ndjson",
+        )
+
+    @app.get("/api/timeline")
+    async def get_timeline(
+        accept_encoding: str | None = Header(default=None),
+        if_none_match: str | None = Header(default=None),
+    ):
+        return send_json(timeline_payload, accept_encoding, if_none_match)
+
+    @app.get("/api/timeline/full")
+    async def get_timeline_full(
+        accept_encoding: str | None = Header(default=None),
+        if_none_match: str | None = Header(default=None),
+    ):
+        return send_json(timeline_full_payload, accept_encoding, if_none_match)
 
     return app
 
 
+# Bodies below this size aren't worth a Content-Encoding round trip
+_GZIP_MIN_SIZE = 1024
+
+
+class _EncodedBody(NamedTuple):
+    """A response body encoded once, with its gzip variant and ETags."""
+    body: bytes
+    etag: str
+    gzipped: bytes | None = None
+    gzip_etag: str = ""
+
+
+def _encode_body(body: bytes) -> _EncodedBody:
+    """Hash a body and pre-compress it if it is large enough to benefit."""
+    # 64-bit BLAKE2b: faster than MD5 on 64-bit CPUs and ample for validators
+    digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    if len(body) < _GZIP_MIN_SIZE:
+        return _EncodedBody(body, f'"{digest}"')
+    # mtime=0 keeps the compressed bytes deterministic
+    gzipped = gzip.compress(body, compresslevel=6, mtime=0)
+    return _EncodedBody(body, f'"{digest}"', gzipped, f'"{digest}-gzip"')
+
+
+def _recording_meta(recording_data: dict[str, Any] | None) -> dict[str, Any]:
+    """Return a recording's top-level fields without its event list."""
+    recording_data = recording_data or {}
+    meta = {k: v for k, v in recording_data.items() if k != "events"}
+    meta.setdefault("event_count", len(recording_data.get("events", [])))
+    return meta
+
+
+def _iter_recording_ndjson(recording_data: dict[str, Any] | None) -> Iterator[bytes]:
+    """
+    Yield a recording as NDJSON: a metadata line, then one line per event.
+
+    Every event line carries a ``summary`` string for display, rendered
+    here for recordings made before summaries were stored with events.
+    """
+    yield dumps(_recording_meta(recording_data)) + b"\n"
+    for event in (recording_data or {}).get("events", []):
+        summary = event.get("summary") or summarize_event(
+            event.get("type", ""), event.get("data") or {}
+        )
+        yield dumps({**event, "summary": summary}) + b"\n"
+
+
+def _build_chart_columns(metrics_data: dict[str, Any] | None) -> dict[str, Any]:
+    """
+    Flatten the metrics into the parallel arrays the dashboard charts plot.
+
+    Agent columns share the order of ``names``; routing and decision counts
+    are split into ``labels`` and ``counts``.
+    """
+    metrics_data = metrics_data or {}
+    agents = list((metrics_data.get("agents") or {}).values())
+    conductor = metrics_data.get("conductor") or {}
+    routing = conductor.get("routing_counts") or {}
+    decisions = conductor.get("decision_counts") or {}
+    return {
+        "names": [a.get("name", "") for a in agents],
+        "input_tokens": [a.get("total_input_tokens", 0) for a in agents],
+        "output_tokens": [a.get("total_output_tokens", 0) for a in agents],
+        "avg_latency_s": [a.get("avg_latency_s", 0.0) for a in agents],
+        "routing": {"labels": list(routing), "counts": list(routing.values())},
+        "decisions": {"labels": list(decisions), "counts": list(decisions.values())},
+    }
+
+
+def _build_timeline(
+    recording_data: dict[str, Any] | None, include_data: bool = False
+) -> list[dict[str, Any]]:
+    """
+    Build the simplified timeline items for a recording.
+
+    Each item carries a server-rendered ``summary``; the raw event ``data``
+    is only included when ``include_data`` is set.
+    """
+    if not recording_data:
+        return []
+    events = recording_data.get("events", [])
+    items = [
+        {
+            "step": e.get("step", 0),
+            "timestamp": e.get("timestamp", 0),
+            "type": e.get("type", ""),
+            # Recordings made before summaries were stored are rendered here
+            "summary": e.get("summary") or summarize_event(e.get("type", ""), e.get("data") or {}),
+        }
+        for e in events
+    ]
+    if include_data:
+        for item, e in zip(items, events):
+            item["data"] = e.get("data") or {}
+    return items
+
+
 def _dashboard_html() -> str:
     """Generate the full dashboard HTML page."""
     return """<!DOCTYPE html>
@@ -202,14 +386,17 @@ td { color: var(--text-primary); }
 }
 .timeline-card h3 { font-size: 14px; margin-bottom: 12px; color: var(--text-secondary); }
 .timeline { max-height: 500px; overflow-y: auto; }
+/* Virtualized: the spacer has the full list height, the window holds only visible rows */
+.timeline-spacer { position: relative; }
+.timeline-window { position: absolute; top: 0; left: 0; right: 0; }
 .timeline-item {
     display: flex;
-    align-items: flex-start;
-    padding: 8px 0;
+    align-items: center;
+    box-sizing: border-box;
+    height: 32px;
     border-bottom: 1px solid var(--border);
     font-size: 13px;
 }
-.timeline-item:last-child { border-bottom: none; }
 .timeline-step {
     min-width: 40px;
     color: var(--accent-blue);
@@ -229,7 +416,14 @@ td { color: var(--text-primary); }
 .timeline-type.consensus_review { background: rgba(245, 158, 11, 0.15); color: var(--accent-orange); }
 .timeline-type.status_change { background: rgba(239, 68, 68, 0.15); color: var(--accent-red); }
 .timeline-type.error { background: rgba(239, 68, 68, 0.3); color: var(--accent-red); }
-.timeline-summary { color: var(--text-primary); flex: 1; }
+.timeline-summary {
+    color: var(--text-primary);
+    flex: 1;
+    min-width: 0;
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+}
 
 .loading { text-align: center; padding: 40px; color: var(--text-secondary); }
 
@@ -249,13 +443,12 @@ td { color: var(--text-primary); }
 </div>
 
 <script>
-async function loadData() {
-    const [metricsRes, timelineRes, recordingRes] = await Promise.all([
-        fetch('/api/metrics').then(r => r.json()),
-        fetch('/api/timeline').then(r => r.json()),
-        fetch('/api/recording').then(r => r.json()),
-    ]);
-    return { metrics: metricsRes, timeline: timelineRes, recording: recordingRes };
+async function loadDashboard() {
+    const res = await fetch('/api/snapshot');
+    if (!res.ok) throw new Error(`/api/snapshot: HTTP ${res.status}`);
+    const { metrics, charts, recording, timeline } = await res.json();
+    renderDashboard(metrics, charts, recording);
+    appendTimeline(timeline);
 }
 
 function formatNumber(n) {
@@ -264,12 +457,10 @@ function formatNumber(n) {
     return n.toString();
 }
 
-function renderDashboard(data) {
-    const { metrics, timeline, recording } = data;
+function renderDashboard(metrics, charts, recording) {
     const ts = metrics.task_summary || {};
     const agents = metrics.agents || {};
     const consensus = metrics.consensus || {};
-    const conductor = metrics.conductor || {};
 
     // Task info
     document.getElementById('taskInfo').textContent =
@@ -328,94 +519,137 @@ function renderDashboard(data) {
     }
     html += `</tbody></table></div>`;
 
-    // Timeline
-    html += `<div class="timeline-card"><h3>Event Timeline (${timeline.length} events)</h3><div class="timeline">`;
-    for (const item of timeline) {
+    // Timeline (rows are materialized by appendTimeline / renderTimelineWindow)
+    html += `<div class="timeline-card">
+        <h3>Event Timeline (<span id="timelineCount">0</span> events)</h3>
+        <div class="timeline" id="timeline"><div class="timeline-spacer" id="timelineSpacer">
+            <div class="timeline-window" id="timelineWindow"></div>
+        </div></div></div>`;
+
+    document.getElementById('content').innerHTML = html;
+    document.getElementById('timeline')
+        .addEventListener('scroll', scheduleTimelineRender, { passive: true });
+
+    // Render charts
+    _renderTokenChart(charts);
+    _renderLatencyChart(charts);
+    _renderRoutingChart(charts.routing);
+    _renderDecisionChart(charts.decisions);
+}
+
+// Only the rows in view (plus an overscan margin) exist in the DOM
+const TIMELINE_ROW_HEIGHT = 32;
+const TIMELINE_OVERSCAN = 10;
+const timelineItems = [];
+let timelineFrame = 0;
+let timelineRange = '';
+
+function appendTimeline(items) {
+    if (!items.length) return;
+    for (const item of items) timelineItems.push(item);
+    document.getElementById('timelineCount').textContent = timelineItems.length;
+    const height = timelineItems.length * TIMELINE_ROW_HEIGHT;
+    document.getElementById('timelineSpacer').style.height = `${height}px`;
+    scheduleTimelineRender();
+}
+
+function scheduleTimelineRender() {
+    if (!timelineFrame) timelineFrame = requestAnimationFrame(renderTimelineWindow);
+}
+
+function renderTimelineWindow() {
+    timelineFrame = 0;
+    const viewport = document.getElementById('timeline');
+    const top = viewport.scrollTop;
+    const first = Math.max(0, Math.floor(top / TIMELINE_ROW_HEIGHT) - TIMELINE_OVERSCAN);
+    const bottom = Math.ceil((top + viewport.clientHeight) / TIMELINE_ROW_HEIGHT);
+    const last = Math.min(timelineItems.length, bottom + TIMELINE_OVERSCAN);
+    const range = `${first}:${last}`;
+    if (range === timelineRange) return;
+    timelineRange = range;
+
+    let html = '';
+    for (let i = first; i < last; i++) {
+        const item = timelineItems[i];
         const typeClass = item.type.replace(/[^a-z_]/g, '');
-        const summary = _eventSummary(item);
+        const summary = escapeHtml(item.summary || '');
         html += `<div class="timeline-item">
             <div class="timeline-step">S${item.step}</div>
             <div class="timeline-type ${typeClass}">${item.type}</div>
             <div class="timeline-summary">${summary}</div>
         </div>`;
     }
-    html += `</div></div>`;
-
-    document.getElementById('content').innerHTML = html;
-
-    // Render charts
-    _renderTokenChart(agents);
-    _renderLatencyChart(agents);
-    _renderRoutingChart(conductor.routing_counts || {});
-    _renderDecisionChart(conductor.decision_counts || {});
+    const win = document.getElementById('timelineWindow');
+    win.style.transform = `translateY(${first * TIMELINE_ROW_HEIGHT}px)`;
+    win.innerHTML = html;
 }
 
-function _eventSummary(item) {
-    const d = item.data || {};
-    switch (item.type) {
-        case 'task_start': return `Task started: ${(d.objective || '').substring(0, 60)}`;
-        case 'task_end': return `Task ended: ${d.status || '?'}`;
-        case 'status_change': return `${d.from || '?'} &rarr; ${d.to || '?'} (${d.reason || ''})`;
-        case 'conductor_decide': return `${d.action || '?'}${d.agent_name ? ' → ' + d.agent_name : ''}: ${d.reasoning || ''}`;
-        case 'agent_start': return `Started: ${d.agent_name || '?'}`;
-        case 'agent_end': return `Finished: ${d.agent_name || '?'} (${d.status}, ${(d.latency_s || 0).toFixed(1)}s, ${(d.input_tokens||0)+(d.output_tokens||0)} tokens)`;
-        case 'consensus_review': return `${d.reviewer || '?'}: ${d.verdict || '?'} — ${(d.critique || '').substring(0, 80)}`;
-        case 'consensus_end': return `${d.outcome || '?'} for ${d.target_field || '?'} (${d.iterations} iter)`;
-        case 'error': return `${d.source || '?'}: ${(d.error || '').substring(0, 80)}`;
-        default: return JSON.stringify(d).substring(0, 100);
-    }
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+
+function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
 }
 
 const COLORS = ['#4f8ff7', '#3dd68c', '#a78bfa', '#f59e0b', '#ef4444', '#ec4899', '#06b6d4'];
 
-function _renderTokenChart(agents) {
-    const names = Object.keys(agents);
+function _renderTokenChart(charts) {
     new Chart(document.getElementById('tokenChart'), {
         type: 'bar',
         data: {
-            labels: names,
+            labels: charts.names,
             datasets: [
-                { label: 'Input Tokens', data: names.map(n => agents[n].total_input_tokens), backgroundColor: '#4f8ff7' },
-                { label: 'Output Tokens', data: names.map(n => agents[n].total_output_tokens), backgroundColor: '#3dd68c' },
+                { label: 'Input Tokens', data: charts.input_tokens, backgroundColor: '#4f8ff7' },
+                { label: 'Output Tokens', data: charts.output_tokens, backgroundColor: '#3dd68c' },
             ]
         },
         options: { responsive: true, scales: { x: { ticks: { color: '#8b8fa3' } }, y: { ticks: { color: '#8b8fa3' } } }, plugins: { legend: { labels: { color: '#e4e6f0' } } } }
     });
 }
 
-function _renderLatencyChart(agents) {
-    const names = Object.keys(agents);
+function _renderLatencyChart(charts) {
     new Chart(document.getElementById('latencyChart'), {
         type: 'bar',
         data: {
-            labels: names,
-            datasets: [{ label: 'Avg Latency (s)', data: names.map(n => agents[n].avg_latency_s), backgroundColor: '#a78bfa' }]
+            labels: charts.names,
+            datasets: [{
+                label: 'Avg Latency (s)',
+                data: charts.avg_latency_s,
+                backgroundColor: '#a78bfa',
+            }]
         },
         options: { responsive: true, scales: { x: { ticks: { color: '#8b8fa3' } }, y: { ticks: { color: '#8b8fa3' } } }, plugins: { legend: { labels: { color: '#e4e6f0' } } } }
     });
 }
 
 function _renderRoutingChart(routing) {
-    const labels = Object.keys(routing);
     new Chart(document.getElementById('routingChart'), {
         type: 'doughnut',
-        data: { labels, datasets: [{ data: labels.map(l => routing[l]), backgroundColor: COLORS }] },
+        data: {
+            labels: routing.labels,
+            datasets: [{ data: routing.counts, backgroundColor: COLORS }],
+        },
         options: { responsive: true, plugins: { legend: { labels: { color: '#e4e6f0' } } } }
     });
 }
 
 function _renderDecisionChart(decisions) {
-    const labels = Object.keys(decisions);
     new Chart(document.getElementById('decisionChart'), {
         type: 'doughnut',
-        data: { labels, datasets: [{ data: labels.map(l => decisions[l]), backgroundColor: COLORS.slice(2) }] },
+        data: {
+            labels: decisions.labels,
+            datasets: [{ data: decisions.counts, backgroundColor: COLORS.slice(2) }],
+        },
         options: { responsive: true, plugins: { legend: { labels: { color: '#e4e6f0' } } } }
     });
 }
 
-loadData().then(renderDashboard).catch(err => {
+loadDashboard().catch(err => {
     document.getElementById('content').innerHTML = `<div class="loading">Error loading data: ${err.message}</div>`;
 });
 </script>
 </body>
 </html>"""
+
+
+# The page is a constant, so it is encoded, compressed and hashed once at import time
+_DASHBOARD_PAGE = _encode_body(_dashboard_html().encode("utf-8"))
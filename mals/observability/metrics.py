@@ -15,16 +15,48 @@ for dashboard rendering or benchmark reporting.
 
 from __future__ import annotations
 
+import array
+import collections
+import heapq
 import logging
-import statistics
+import math
+import sys
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
+from mals.utils.serialization import dumps, loads
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
 logger = logging.getLogger("mals.observability.metrics")
 
 
-@dataclass
+def _percentile(values: Sequence[float], q: float) -> float:
+    """
+    Return the sample at rank ``int(len(values) * q)`` without a full sort.
+
+    Uses ``numpy.partition`` (O(N) selection) when numpy is installed and
+    ``heapq.nlargest`` over the upper tail otherwise.
+    """
+    n = len(values)
+    if n == 0:
+        return 0.0
+    k = min(int(n * q), n - 1)
+    if np is not None:
+        if isinstance(values, array.array):
+            arr = np.frombuffer(values, dtype=np.float64)  # zero-copy view
+        else:
+            arr = np.asarray(values, dtype=np.float64)
+        return float(np.partition(arr, k)[k])
+    return heapq.nlargest(n - k, values)[-1]
+
+
+@dataclass(slots=True)
 class AgentMetrics:
     """Aggregated metrics for a single specialist agent."""
     name: str
@@ -33,7 +65,30 @@ class AgentMetrics:
     error_count: int = 0
     total_input_tokens: int = 0
     total_output_tokens: int = 0
-    latencies: list[float] = field(default_factory=list)
+    # Unboxed float64 samples: 8 bytes each instead of a PyFloat per entry.
+    # With `latency_window` set, only the most recent samples are kept and
+    # the buffer is overwritten in place as a ring (not in arrival order).
+    latencies: array.array = field(default_factory=lambda: array.array("d"))
+    latency_window: int | None = None
+    # Running aggregates over every sample, so exports don't re-scan `latencies`
+    latency_count: int = 0
+    latency_sum: float = 0.0
+    latency_min: float = math.inf
+    latency_max: float = 0.0
+
+    def add_latency(self, latency: float) -> None:
+        """Record one latency sample and update the running aggregates."""
+        window = self.latency_window
+        if window is not None and self.latency_count >= window:
+            self.latencies[self.latency_count % window] = latency
+        else:
+            self.latencies.append(latency)
+        self.latency_count += 1
+        self.latency_sum += latency
+        if latency < self.latency_min:
+            self.latency_min = latency
+        if latency > self.latency_max:
+            self.latency_max = latency
 
     @property
     def total_tokens(self) -> int:
@@ -41,23 +96,19 @@ class AgentMetrics:
 
     @property
     def avg_latency(self) -> float:
-        return statistics.mean(self.latencies) if self.latencies else 0.0
+        return self.latency_sum / self.latency_count if self.latency_count else 0.0
 
     @property
     def p95_latency(self) -> float:
-        if len(self.latencies) < 2:
-            return self.latencies[0] if self.latencies else 0.0
-        sorted_lats = sorted(self.latencies)
-        idx = int(len(sorted_lats) * 0.95)
-        return sorted_lats[min(idx, len(sorted_lats) - 1)]
+        return _percentile(self.latencies, 0.95)
 
     @property
     def min_latency(self) -> float:
-        return min(self.latencies) if self.latencies else 0.0
+        return self.latency_min if self.latency_count else 0.0
 
     @property
     def max_latency(self) -> float:
-        return max(self.latencies) if self.latencies else 0.0
+        return self.latency_max if self.latency_count else 0.0
 
     @property
     def success_rate(self) -> float:
@@ -65,7 +116,24 @@ class AgentMetrics:
             return 0.0
         return self.success_count / self.invocation_count
 
+    def latency_stats(self) -> tuple[float, float, float, float]:
+        """
+        Return ``(avg, p95, min, max)`` latency in one call, selecting p95 once.
+
+        avg/min/max cover every sample; p95 covers the retained window.
+        """
+        n = self.latency_count
+        if n == 0:
+            return 0.0, 0.0, 0.0, 0.0
+        return (
+            self.latency_sum / n,
+            _percentile(self.latencies, 0.95),
+            self.latency_min,
+            self.latency_max,
+        )
+
     def to_dict(self) -> dict[str, Any]:
+        avg, p95, lo, hi = self.latency_stats()
         return {
             "name": self.name,
             "invocation_count": self.invocation_count,
@@ -74,15 +142,15 @@ class AgentMetrics:
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
             "total_tokens": self.total_tokens,
-            "avg_latency_s": round(self.avg_latency, 3),
-            "p95_latency_s": round(self.p95_latency, 3),
-            "min_latency_s": round(self.min_latency, 3),
-            "max_latency_s": round(self.max_latency, 3),
+            "avg_latency_s": round(avg, 3),
+            "p95_latency_s": round(p95, 3),
+            "min_latency_s": round(lo, 3),
+            "max_latency_s": round(hi, 3),
             "success_rate": round(self.success_rate, 4),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsensusMetrics:
     """Aggregated metrics for the consensus loop."""
     total_cycles: int = 0
@@ -94,7 +162,7 @@ class ConsensusMetrics:
 
     @property
     def avg_iterations(self) -> float:
-        return statistics.mean(self.iterations_per_cycle) if self.iterations_per_cycle else 0.0
+        return self.total_iterations / self.total_cycles if self.total_cycles else 0.0
 
     @property
     def first_try_approval_rate(self) -> float:
@@ -114,15 +182,23 @@ class ConsensusMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConductorMetrics:
     """Aggregated metrics for the Conductor."""
     total_steps: int = 0
     total_input_tokens: int = 0
     total_output_tokens: int = 0
-    decision_counts: dict[str, int] = field(default_factory=dict)
-    routing_counts: dict[str, int] = field(default_factory=dict)
-    latencies: list[float] = field(default_factory=list)
+    # Counter rather than defaultdict: reading a missing key doesn't insert it
+    decision_counts: collections.Counter[str] = field(default_factory=collections.Counter)
+    routing_counts: collections.Counter[str] = field(default_factory=collections.Counter)
+    latencies: array.array = field(default_factory=lambda: array.array("d"))
+    # Running total, so exports don't re-sum `latencies`
+    latency_sum: float = 0.0
+
+    def add_latency(self, latency: float) -> None:
+        """Record one step latency and update the running total."""
+        self.latencies.append(latency)
+        self.latency_sum += latency
 
     @property
     def total_tokens(self) -> int:
@@ -130,7 +206,7 @@ class ConductorMetrics:
 
     @property
     def avg_latency(self) -> float:
-        return statistics.mean(self.latencies) if self.latencies else 0.0
+        return self.latency_sum / len(self.latencies) if self.latencies else 0.0
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -157,14 +233,38 @@ class MetricsCollector:
         report = collector.to_dict()
     """
 
-    def __init__(self) -> None:
-        self._task_start: float = time.time()
+    def __init__(self, latency_window: int | None = None) -> None:
+        """
+        Args:
+            latency_window: Keep at most this many latency samples per agent
+                for p95 (avg/min/max still cover every sample). None keeps all.
+        """
+        if latency_window is not None and latency_window < 1:
+            raise ValueError("latency_window must be a positive integer")
+        self._latency_window = latency_window
+        # Monotonic clock, so elapsed time is immune to wall-clock adjustments
+        self._task_start: float = time.monotonic()
         self._task_end: float | None = None
         self._agent_metrics: dict[str, AgentMetrics] = {}
+        # Cross-agent totals, kept in step with record_agent_invocation()
+        self._agent_invocations_total: int = 0
+        self._agent_input_total: int = 0
+        self._agent_output_total: int = 0
         self._conductor = ConductorMetrics()
         self._consensus = ConsensusMetrics()
         self._memory_compressions: int = 0
-        self._status_transitions: list[dict[str, Any]] = []
+        # Status transitions as parallel columns; statuses are interned since
+        # only a handful of distinct values ever occur
+        self._trans_from: list[str] = []
+        self._trans_to: list[str] = []
+        self._trans_reason: list[str] = []
+        self._trans_ts: array.array = array.array("d")
+        # Bumped by every record_* call; keys the export cache
+        self._version: int = 0
+        self._cached_version: int = -1
+        self._cached_dict: dict[str, Any] | None = None
+        self._cached_bytes: bytes | None = None
+        self._cached_text: str | None = None
 
     # ------------------------------------------------------------------
     # Agent Metrics
@@ -180,14 +280,20 @@ class MetricsCollector:
         error: str | None = None,
     ) -> None:
         """Record a single agent invocation."""
+        self._version += 1
         if agent_name not in self._agent_metrics:
-            self._agent_metrics[agent_name] = AgentMetrics(name=agent_name)
+            self._agent_metrics[agent_name] = AgentMetrics(
+                name=agent_name, latency_window=self._latency_window
+            )
 
         m = self._agent_metrics[agent_name]
         m.invocation_count += 1
-        m.latencies.append(latency)
+        m.add_latency(latency)
         m.total_input_tokens += input_tokens
         m.total_output_tokens += output_tokens
+        self._agent_invocations_total += 1
+        self._agent_input_total += input_tokens
+        self._agent_output_total += output_tokens
 
         if success:
             m.success_count += 1
@@ -212,21 +318,20 @@ class MetricsCollector:
         output_tokens: int = 0,
     ) -> None:
         """Record a single Conductor decision step."""
-        self._conductor.total_steps += 1
-        self._conductor.total_input_tokens += input_tokens
-        self._conductor.total_output_tokens += output_tokens
-        self._conductor.latencies.append(latency)
-
-        # Track decision type distribution
-        self._conductor.decision_counts[action] = (
-            self._conductor.decision_counts.get(action, 0) + 1
-        )
+        self._version += 1
+        conductor = self._conductor
+        conductor.total_steps += 1
+        conductor.total_input_tokens += input_tokens
+        conductor.total_output_tokens += output_tokens
+        conductor.add_latency(latency)
+
+        # Track decision type distribution. Keys are interned: the same few
+        # names recur every step, so lookups compare by identity.
+        conductor.decision_counts[sys.intern(action)] += 1
 
         # Track routing distribution
         if agent_name:
-            self._conductor.routing_counts[agent_name] = (
-                self._conductor.routing_counts.get(agent_name, 0) + 1
-            )
+            conductor.routing_counts[sys.intern(agent_name)] += 1
 
     # ------------------------------------------------------------------
     # Consensus Metrics
@@ -238,6 +343,7 @@ class MetricsCollector:
         outcome: str,  # "approved_first_try", "approved_after_revision", "force_approved"
     ) -> None:
         """Record a completed consensus cycle."""
+        self._version += 1
         self._consensus.total_cycles += 1
         self._consensus.total_iterations += iterations
         self._consensus.iterations_per_cycle.append(iterations)
@@ -255,6 +361,7 @@ class MetricsCollector:
 
     def record_memory_compression(self) -> None:
         """Record a memory compression event (hot → warm)."""
+        self._version += 1
         self._memory_compressions += 1
 
     # ------------------------------------------------------------------
@@ -265,12 +372,21 @@ class MetricsCollector:
         self, from_status: str, to_status: str, reason: str
     ) -> None:
         """Record a global status transition."""
-        self._status_transitions.append({
-            "from": from_status,
-            "to": to_status,
-            "reason": reason,
-            "timestamp": time.time(),
-        })
+        self._version += 1
+        self._trans_from.append(sys.intern(from_status))
+        self._trans_to.append(sys.intern(to_status))
+        self._trans_reason.append(reason)
+        self._trans_ts.append(time.time())
+
+    @property
+    def _status_transitions(self) -> list[dict[str, Any]]:
+        """Status transitions as dicts, built from the columnar log on access."""
+        return [
+            {"from": frm, "to": to, "reason": reason, "timestamp": ts}
+            for frm, to, reason, ts in zip(
+                self._trans_from, self._trans_to, self._trans_reason, self._trans_ts
+            )
+        ]
 
     # ------------------------------------------------------------------
     # Task Lifecycle
@@ -278,12 +394,33 @@ class MetricsCollector:
 
     def mark_task_complete(self) -> None:
         """Mark the task as complete and record the end time."""
-        self._task_end = time.time()
+        self._version += 1
+        self._task_end = time.monotonic()
+
+    def token_usage(self) -> dict[str, Any]:
+        """
+        Return the task's token usage, split into conductor and agent calls.
+
+        Built from the usage reported with each recorded call, so it only
+        counts this task even when LLM clients are shared between tasks.
+        """
+        conductor = self._conductor
+        return {
+            "conductor": {
+                "input": conductor.total_input_tokens,
+                "output": conductor.total_output_tokens,
+            },
+            "agents": {
+                "input": self._agent_input_total,
+                "output": self._agent_output_total,
+            },
+            "total": conductor.total_tokens + self._agent_input_total + self._agent_output_total,
+        }
 
     @property
     def elapsed_time(self) -> float:
         """Total elapsed time in seconds."""
-        end = self._task_end or time.time()
+        end = self._task_end if self._task_end is not None else time.monotonic()
         return end - self._task_start
 
     # ------------------------------------------------------------------
@@ -295,26 +432,52 @@ class MetricsCollector:
         Export all collected metrics as a structured dictionary.
 
         Suitable for JSON serialization, dashboard rendering, or benchmark reporting.
+        Each call returns a fresh copy decoded from the cached JSON, so callers
+        may mutate it freely.
         """
-        # Aggregate token totals
-        total_agent_input = sum(m.total_input_tokens for m in self._agent_metrics.values())
-        total_agent_output = sum(m.total_output_tokens for m in self._agent_metrics.values())
-        total_agent_invocations = sum(m.invocation_count for m in self._agent_metrics.values())
+        return loads(self._json_bytes())
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the export dict, cached until the next ``record_*`` call; never handed out."""
+        if self._cached_version != self._version or self._cached_dict is None:
+            self._cached_dict = self._build_dict()
+            self._cached_bytes = None
+            self._cached_text = None
+            self._cached_version = self._version
+        elif self._task_end is None:
+            # Between mutations only the elapsed time of a running task moves
+            elapsed = round(self.elapsed_time, 2)
+            summary = self._cached_dict["task_summary"]
+            if summary["elapsed_time_s"] != elapsed:
+                self._cached_dict = {
+                    **self._cached_dict,
+                    "task_summary": {**summary, "elapsed_time_s": elapsed},
+                }
+                self._cached_bytes = None
+                self._cached_text = None
+        return self._cached_dict
+
+    def _json_bytes(self) -> bytes:
+        """Return the metrics encoded as JSON, cached until the next ``record_*`` call."""
+        data = self._snapshot()
+        if self._cached_bytes is None:
+            self._cached_bytes = dumps(data)
+        return self._cached_bytes
+
+    def _build_dict(self) -> dict[str, Any]:
+        conductor_tokens = self._conductor.total_tokens
+        agent_tokens = self._agent_input_total + self._agent_output_total
 
         return {
             "task_summary": {
                 "elapsed_time_s": round(self.elapsed_time, 2),
                 "total_steps": self._conductor.total_steps,
-                "total_agent_invocations": total_agent_invocations,
-                "total_tokens": (
-                    self._conductor.total_tokens
-                    + total_agent_input
-                    + total_agent_output
-                ),
-                "conductor_tokens": self._conductor.total_tokens,
-                "agent_tokens": total_agent_input + total_agent_output,
+                "total_agent_invocations": self._agent_invocations_total,
+                "total_tokens": conductor_tokens + agent_tokens,
+                "conductor_tokens": conductor_tokens,
+                "agent_tokens": agent_tokens,
                 "memory_compressions": self._memory_compressions,
-                "status_transitions": len(self._status_transitions),
+                "status_transitions": len(self._trans_from),
             },
             "conductor": self._conductor.to_dict(),
             "agents": {
@@ -326,8 +489,14 @@ class MetricsCollector:
         }
 
     def summary_text(self) -> str:
-        """Generate a human-readable summary of the metrics."""
-        d = self.to_dict()
+        """Generate a human-readable summary, cached until the next ``record_*`` call."""
+        d = self._snapshot()
+        if self._cached_text is None:
+            self._cached_text = self._build_summary_text(d)
+        return self._cached_text
+
+    @staticmethod
+    def _build_summary_text(d: dict[str, Any]) -> str:
         ts = d["task_summary"]
         lines = [
             "=== MALS Task Metrics ===",
@@ -8,21 +8,55 @@ what happened during a task execution. This enables:
 - Visualization: feed events into the Dashboard for animated replay
 
 Events are stored in-memory during execution and can be exported to JSON
-for persistent storage.
+for persistent storage, or streamed to a JSON-lines file as they happen.
 """
 
 from __future__ import annotations
 
-import json
+import array
 import logging
+import queue
+import threading
 import time
+from collections import defaultdict, deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+from mals.utils.serialization import dumps, loads
 
 logger = logging.getLogger("mals.observability.recorder")
 
+_MSGPACK_SUFFIXES = frozenset({".msgpack", ".mpk"})
+_JSONL_SUFFIXES = frozenset({".jsonl", ".ndjson"})
+
+# Streamed events are flushed to disk in batches of this many
+_STREAM_FLUSH_EVERY = 64
+_STREAM_BUFFER_SIZE = 1 << 16
+# Events waiting for the background writer; record() blocks when it is full
+_WRITE_QUEUE_SIZE = 4096
+
+# (encoder, decoder) pair, created on first use since msgspec is optional
+_MSGPACK_CODEC: tuple[Any, Any] | None = None
+
+
+def _msgpack_codec() -> tuple[Any, Any]:
+    """Return the shared msgspec MessagePack encoder and decoder."""
+    global _MSGPACK_CODEC
+    if _MSGPACK_CODEC is None:
+        try:
+            import msgspec
+        except ImportError as e:
+            raise ImportError(
+                "MessagePack recordings require the 'msgspec' package. "
+                "Install it with: pip install msgspec"
+            ) from e
+        _MSGPACK_CODEC = (msgspec.msgpack.Encoder(), msgspec.msgpack.Decoder())
+    return _MSGPACK_CODEC
+
 
 class EventType(str, Enum):
     """Categories of recordable events."""
@@ -45,13 +79,24 @@ class EventType(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+def _new_index() -> array.array:
+    """Empty position index for `EventRecorder`: unboxed uint32 event positions."""
+    return array.array("I")
+
+
+# Plain dict lookup for decoding, bypassing EnumMeta.__call__ on every event
+_ET_BY_VALUE: dict[str, EventType] = {m.value: m for m in EventType}
+
+
+@dataclass(slots=True, frozen=True)
 class Event:
     """A single recorded event."""
     type: EventType
     timestamp: float = field(default_factory=time.time)
     data: dict[str, Any] = field(default_factory=dict)
     step: int = 0
+    # One-line display summary, rendered once when the event is recorded
+    summary: str = ""
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -59,22 +104,46 @@ class Event:
             "timestamp": self.timestamp,
             "step": self.step,
             "data": self.data,
+            "summary": self.summary,
         }
 
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> "Event":
+        try:
+            event_type = _ET_BY_VALUE[d["type"]]
+        except KeyError:
+            raise ValueError(f"{d['type']!r} is not a valid EventType") from None
+        # Positional, in field order: (type, timestamp, data, step, summary)
         return cls(
-            type=EventType(d["type"]),
-            timestamp=d["timestamp"],
-            step=d.get("step", 0),
-            data=d.get("data", {}),
+            event_type,
+            d["timestamp"],
+            d.get("data", {}),
+            d.get("step", 0),
+            d.get("summary", ""),
         )
 
+    @classmethod
+    def from_dict_fast(cls, d: dict[str, Any]) -> Event:
+        """
+        Like `from_dict`, for a complete dict as written by `to_dict()`.
+
+        No defaults are filled in: a missing key or unknown type raises KeyError.
+        """
+        return cls(_ET_BY_VALUE[d["type"]], d["timestamp"], d["data"], d["step"], d["summary"])
+
 
 class EventRecorder:
     """
     Records a time-ordered stream of events during MALS task execution.
 
+    By default every event is kept in memory. With ``stream_path`` set, each
+    event is appended to that file as one JSON line when it is recorded and
+    only the most recent ``ring_size`` events stay in memory, which keeps
+    peak memory flat for long runs. ``open_stream()`` attaches a stream to
+    a recorder that is already running. With ``background_writes`` the lines
+    are encoded and written by a writer thread instead of inside ``record()``.
+    Call ``close()`` when done streaming.
+
     Usage:
         recorder = EventRecorder()
         recorder.record(EventType.TASK_START, data={"objective": "..."})
@@ -82,11 +151,48 @@ class EventRecorder:
         recorder.export_json("task_replay.json")
     """
 
-    def __init__(self) -> None:
-        self._events: list[Event] = []
+    def __init__(
+        self,
+        stream_path: str | Path | None = None,
+        ring_size: int = 1024,
+        background_writes: bool = False,
+    ) -> None:
+        self._events: list[Event] | deque[Event]
+        self._stream: BinaryIO | None = None
+        self._background_writes = background_writes
+        self._write_queue: queue.Queue[Event | None] | None = None
+        self._writer: threading.Thread | None = None
+        if stream_path is not None:
+            self._events = deque(maxlen=ring_size)
+        else:
+            self._events = []
+        # Bound once; `record()` is called for every event of a task
+        self._append: Callable[[Event], None] = self._events.append
+        # Positions into `_events` by type and by step, so replay queries don't
+        # rescan the recording. Only kept for the in-memory list; a streaming
+        # ring is bounded, so scanning it is cheap and positions would shift.
+        # Positions are stored unboxed as uint32, 4 bytes each.
+        self._by_type: defaultdict[EventType, array.array] | None = None
+        self._by_step: defaultdict[int, array.array] | None = None
+        if stream_path is None:
+            self._by_type = defaultdict(_new_index)
+            self._by_step = defaultdict(_new_index)
+        self._event_total: int = 0
+        # Timestamps are a monotonic offset from one wall-clock anchor, so
+        # they stay ordered even if the system clock is stepped mid-task.
+        # Anchors are integer nanoseconds, so the offset is exact and only
+        # the final conversion to seconds rounds.
+        self._t0_wall_ns: int = time.time_ns()
+        self._t0_mono_ns: int = time.monotonic_ns()
         self._current_step: int = 0
         self._task_id: str = ""
         self._objective: str = ""
+        # `Event.to_dict()` results for the leading events of the in-memory list
+        self._event_dicts: list[dict[str, Any]] = []
+        # (event_total, task_id, objective, indent) -> encoded `to_bytes()` output
+        self._bytes_cache: tuple[tuple[Any, ...], bytes] | None = None
+        if stream_path is not None:
+            self.open_stream(stream_path)
 
     # ------------------------------------------------------------------
     # Recording
@@ -103,15 +209,98 @@ class EventRecorder:
         Returns:
             The recorded Event object.
         """
+        data = data or {}
         event = Event(
             type=event_type,
+            timestamp=(self._t0_wall_ns + time.monotonic_ns() - self._t0_mono_ns) / 1e9,
             step=self._current_step,
-            data=data or {},
+            data=data,
+            summary=summarize_event(event_type, data),
         )
-        self._events.append(event)
-        logger.debug("Event recorded: %s (step %d)", event_type.value, self._current_step)
+        if self._by_type is not None:
+            # The in-memory list never evicts, so the running total is the index
+            idx = self._event_total
+            self._by_type[event_type].append(idx)
+            self._by_step[self._current_step].append(idx)
+        self._append(event)
+        self._event_total += 1
+        if self._stream is not None:
+            self._emit_line(event)
+            if self._writer is None and self._event_total % _STREAM_FLUSH_EVERY == 0:
+                self._stream.flush()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Event recorded: %s (step %d)", event_type.value, self._current_step)
         return event
 
+    def _emit_line(self, event: Event) -> None:
+        if self._write_queue is not None:
+            self._write_queue.put(event)
+            return
+        # Encoded straight from the dataclass, like `to_bytes()`
+        self._stream.write(dumps(event) + b"\n")
+
+    def _drain_writes(self, write_queue: queue.Queue[Event | None], stream: BinaryIO) -> None:
+        """Writer thread: encode queued events until the ``None`` sentinel."""
+        while True:
+            event = write_queue.get()
+            try:
+                if event is None:
+                    return
+                stream.write(dumps(event) + b"\n")
+                if write_queue.empty():
+                    stream.flush()
+            except Exception:
+                logger.exception("Failed to write event to stream")
+            finally:
+                write_queue.task_done()
+
+    def open_stream(self, path: str | Path) -> None:
+        """
+        Append events to ``path`` as JSON lines from now on.
+
+        Events already held in memory are written first, so the file holds
+        the whole recording. A recorder created without ``stream_path`` keeps
+        its full in-memory list as well.
+        """
+        if self._stream is not None:
+            raise RuntimeError("An event stream is already open; close() it first")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = open(path, "ab", buffering=_STREAM_BUFFER_SIZE)
+        if self._background_writes:
+            self._write_queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+            self._writer = threading.Thread(
+                target=self._drain_writes,
+                args=(self._write_queue, self._stream),
+                name="mals-recorder-writer",
+                daemon=True,
+            )
+            self._writer.start()
+        for event in self._events:
+            self._emit_line(event)
+
+    def flush(self) -> None:
+        """
+        Flush buffered stream writes to disk (no-op without a stream).
+
+        With background writes, this waits for the writer to catch up.
+        """
+        if self._write_queue is not None:
+            self._write_queue.join()
+        if self._stream is not None:
+            self._stream.flush()
+
+    def close(self) -> None:
+        """Flush and close the event stream, if any. Recording stays in memory only."""
+        if self._writer is not None:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._write_queue = None
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
     def set_step(self, step: int) -> None:
         """Update the current step counter."""
         self._current_step = step
@@ -133,10 +322,11 @@ class EventRecorder:
         })
 
     def record_task_end(self, status: str, summary: dict[str, Any] | None = None) -> None:
-        self.record(EventType.TASK_END, {
-            "status": status,
-            **(summary or {}),
-        })
+        data: dict[str, Any] = {"status": status}
+        if summary:
+            data.update(summary)
+        self.record(EventType.TASK_END, data)
+        self.flush()
 
     def record_status_change(self, from_status: str, to_status: str, reason: str) -> None:
         self.record(EventType.STATUS_CHANGE, {
@@ -233,56 +423,179 @@ class EventRecorder:
 
     @property
     def events(self) -> list[Event]:
-        """Return all recorded events."""
+        """Return all events held in memory (the most recent ones when streaming)."""
         return list(self._events)
 
     @property
     def event_count(self) -> int:
-        return len(self._events)
+        """Total number of events recorded, including any no longer held in memory."""
+        return self._event_total
 
     def to_dict(self) -> dict[str, Any]:
-        """Export the full recording as a dictionary."""
+        """
+        Export the recording (the in-memory events) as a dictionary.
+
+        Per-event dicts are built once and cached, so polling only converts
+        events recorded since the last export. Callers get shallow copies of
+        the cached dicts, which they may modify freely.
+        """
+        events = self._events
+        if isinstance(events, list):
+            cached = self._event_dicts
+            if len(cached) < len(events):
+                cached.extend([e.to_dict() for e in islice(events, len(cached), None)])
+            event_dicts = [d.copy() for d in cached]
+        else:
+            event_dicts = [e.to_dict() for e in events]
         return {
             "task_id": self._task_id,
             "objective": self._objective,
-            "event_count": len(self._events),
-            "events": [e.to_dict() for e in self._events],
+            "event_count": self._event_total,
+            "events": event_dicts,
+        }
+
+    def to_bytes(self, indent: bool = False) -> bytes:
+        """
+        Encode the recording as JSON, equivalent to ``dumps(self.to_dict())``.
+
+        Events are handed to the encoder as dataclasses, so orjson writes them
+        directly instead of going through one intermediate dict per event.
+        The recording is append-only, so the result is reused until another
+        event is recorded or the task info changes.
+        """
+        key = (self._event_total, self._task_id, self._objective, indent)
+        if self._bytes_cache is not None and self._bytes_cache[0] == key:
+            return self._bytes_cache[1]
+        raw = dumps(self._export_payload(), indent=indent)
+        self._bytes_cache = (key, raw)
+        return raw
+
+    def _export_payload(self) -> dict[str, Any]:
+        return {
+            "task_id": self._task_id,
+            "objective": self._objective,
+            "event_count": self._event_total,
+            "events": self._events if isinstance(self._events, list) else list(self._events),
         }
 
     def export_json(self, path: str | Path) -> None:
         """Export the recording to a JSON file."""
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        path.write_bytes(self.to_bytes(indent=True))
         logger.info("Recording exported to %s (%d events)", path, len(self._events))
 
-    @classmethod
-    def load_json(cls, path: str | Path) -> "EventRecorder":
-        """Load a recording from a JSON file."""
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+    def export_msgpack(self, path: str | Path) -> None:
+        """Export the recording to a MessagePack file (requires msgspec)."""
+        encoder, _ = _msgpack_codec()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # msgspec, like orjson, encodes the Event dataclasses natively
+        path.write_bytes(encoder.encode(self._export_payload()))
+        logger.info("Recording exported to %s (%d events)", path, len(self._events))
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> EventRecorder:
+        """Rebuild a recorder from the output of `to_dict()`."""
         recorder = cls()
         recorder._task_id = data.get("task_id", "")
         recorder._objective = data.get("objective", "")
-        recorder._events = [Event.from_dict(e) for e in data.get("events", [])]
-        if recorder._events:
-            recorder._current_step = max(e.step for e in recorder._events)
+        raw_events = data.get("events", [])
+        try:
+            # Exports from this version carry every key; older ones fall back
+            recorder._events = [Event.from_dict_fast(e) for e in raw_events]
+        except KeyError:
+            from_dict = Event.from_dict
+            recorder._events = [from_dict(e) for e in raw_events]
+        recorder._after_load()
+        return recorder
+
+    @classmethod
+    def from_bytes(cls, raw: bytes | str) -> EventRecorder:
+        """Rebuild a recorder from JSON produced by `to_bytes()`."""
+        return cls.from_dict(loads(raw))
+
+    @classmethod
+    def load_jsonl(cls, path: str | Path) -> EventRecorder:
+        """Load a recording streamed as JSON lines, one event per line."""
+        recorder = cls()
+        from_dict = Event.from_dict
+        with open(path, "rb") as f:
+            events = [from_dict(loads(line)) for line in f if line.strip()]
+        recorder._events = events
+        # Task metadata isn't written to the stream; recover it from task_start
+        for event in events:
+            if event.type == EventType.TASK_START:
+                recorder._task_id = event.data.get("task_id", "")
+                recorder._objective = event.data.get("objective", "")
+                break
+        recorder._after_load()
+        logger.info("Recording loaded from %s (%d events)", path, len(events))
+        return recorder
+
+    def _after_load(self) -> None:
+        self._append = self._events.append
+        self._event_dicts = []
+        events = self._events
+        self._event_total = len(events)
+        if not events:
+            return
+        if self._by_type is None:
+            self._current_step = max(e.step for e in events)
+            return
+        # Indices and the resume step in one pass over the loaded events
+        by_type, by_step = self._by_type, self._by_step
+        max_step = events[0].step
+        for idx, event in enumerate(events):
+            step = event.step
+            by_type[event.type].append(idx)
+            by_step[step].append(idx)
+            if step > max_step:
+                max_step = step
+        self._current_step = max_step
+
+    @classmethod
+    def load_json(cls, path: str | Path) -> "EventRecorder":
+        """Load a recording from a JSON file."""
+        recorder = cls.from_bytes(Path(path).read_bytes())
         logger.info("Recording loaded from %s (%d events)", path, len(recorder._events))
         return recorder
 
+    @classmethod
+    def load_msgpack(cls, path: str | Path) -> EventRecorder:
+        """Load a recording from a MessagePack file (requires msgspec)."""
+        _, decoder = _msgpack_codec()
+        recorder = cls.from_dict(decoder.decode(Path(path).read_bytes()))
+        logger.info("Recording loaded from %s (%d events)", path, len(recorder._events))
+        return recorder
+
+    @classmethod
+    def load(cls, path: str | Path) -> EventRecorder:
+        """Load a recording, choosing MessagePack, JSON lines or JSON from the file suffix."""
+        suffix = Path(path).suffix.lower()
+        if suffix in _MSGPACK_SUFFIXES:
+            return cls.load_msgpack(path)
+        if suffix in _JSONL_SUFFIXES:
+            return cls.load_jsonl(path)
+        return cls.load_json(path)
+
     # ------------------------------------------------------------------
     # Replay helpers
     # ------------------------------------------------------------------
 
     def events_by_type(self, event_type: EventType) -> list[Event]:
         """Filter events by type."""
-        return [e for e in self._events if e.type == event_type]
+        if self._by_type is None:
+            return [e for e in self._events if e.type == event_type]
+        events = self._events
+        return [events[i] for i in self._by_type.get(event_type, ())]
 
     def events_in_step(self, step: int) -> list[Event]:
         """Get all events that occurred during a specific step."""
-        return [e for e in self._events if e.step == step]
+        if self._by_step is None:
+            return [e for e in self._events if e.step == step]
+        events = self._events
+        return [events[i] for i in self._by_step.get(step, ())]
 
     def timeline(self) -> list[dict[str, Any]]:
         """
@@ -290,44 +603,90 @@ class EventRecorder:
 
         Returns a list of dicts with: step, timestamp, type, summary.
         """
-        timeline_items = []
-        for event in self._events:
-            summary = _event_summary(event)
-            timeline_items.append({
+        summarize = summarize_event
+        return [
+            {
                 "step": event.step,
                 "timestamp": event.timestamp,
                 "type": event.type.value,
-                "summary": summary,
-            })
-        return timeline_items
-
-
-def _event_summary(event: Event) -> str:
-    """Generate a one-line human-readable summary of an event."""
-    d = event.data
-    match event.type:
-        case EventType.TASK_START:
-            return f"Task started: {d.get('objective', '')[:60]}"
-        case EventType.TASK_END:
-            return f"Task ended: {d.get('status', 'unknown')}"
-        case EventType.STATUS_CHANGE:
-            return f"Status: {d.get('from', '?')} → {d.get('to', '?')}"
-        case EventType.CONDUCTOR_DECIDE:
-            agent = d.get('agent_name', '')
-            return f"Conductor → {d.get('action', '?')}" + (f" ({agent})" if agent else "")
-        case EventType.AGENT_START:
-            return f"Agent started: {d.get('agent_name', '?')}"
-        case EventType.AGENT_END:
-            return f"Agent finished: {d.get('agent_name', '?')} ({d.get('status', '?')}, {d.get('latency_s', 0):.1f}s)"
-        case EventType.WORKSPACE_WRITE:
-            return f"Workspace write: {d.get('field', '?')}"
-        case EventType.CONSENSUS_REVIEW:
-            return f"Review by {d.get('reviewer', '?')}: {d.get('verdict', '?')}"
-        case EventType.CONSENSUS_END:
-            return f"Consensus {d.get('outcome', '?')} for {d.get('target_field', '?')}"
-        case EventType.MEMORY_COMPRESS:
-            return f"Memory compressed: {d.get('field', '?')}"
-        case EventType.ERROR:
-            return f"Error in {d.get('source', '?')}: {d.get('error', '')[:60]}"
-        case _:
-            return event.type.value
+                "summary": event.summary or summarize(event.type, event.data),
+            }
+            for event in self._events
+        ]
+
+
+def _summarize_status_change(d: dict[str, Any]) -> str:
+    reason = d.get('reason', '')
+    return f"Status: {d.get('from', '?')} → {d.get('to', '?')}" + (f" ({reason})" if reason else "")
+
+
+def _summarize_conductor_decide(d: dict[str, Any]) -> str:
+    agent = d.get('agent_name', '')
+    reasoning = d.get('reasoning', '')
+    return (
+        f"Conductor → {d.get('action', '?')}"
+        + (f" ({agent})" if agent else "")
+        + (f": {reasoning}" if reasoning else "")
+    )
+
+
+def _summarize_agent_end(d: dict[str, Any]) -> str:
+    tokens = (d.get('input_tokens') or 0) + (d.get('output_tokens') or 0)
+    latency = d.get('latency_s')
+    timing = f", {latency:.1f}s" if isinstance(latency, (int, float)) else ""
+    return (
+        f"Agent finished: {d.get('agent_name', '?')} "
+        f"({d.get('status', '?')}{timing}, {tokens} tokens)"
+    )
+
+
+def _summarize_consensus_review(d: dict[str, Any]) -> str:
+    critique = d.get('critique')
+    return (
+        f"Review by {d.get('reviewer', '?')}: {d.get('verdict', '?')}"
+        + (f" — {str(critique)[:80]}" if critique else "")
+    )
+
+
+def _summarize_consensus_end(d: dict[str, Any]) -> str:
+    iterations = d.get('iterations')
+    return (
+        f"Consensus {d.get('outcome', '?')} for {d.get('target_field', '?')}"
+        + (f" ({iterations} iter)" if iterations is not None else "")
+    )
+
+
+# One formatter per event type. EventType is a str enum, so the table can be
+# indexed with either a member or its string value.
+_SUMMARY_FNS: dict[EventType, Callable[[dict[str, Any]], str]] = {
+    EventType.TASK_START: lambda d: f"Task started: {str(d.get('objective') or '')[:60]}",
+    EventType.TASK_END: lambda d: f"Task ended: {d.get('status', 'unknown')}",
+    EventType.STATUS_CHANGE: _summarize_status_change,
+    EventType.CONDUCTOR_DECIDE: _summarize_conductor_decide,
+    EventType.AGENT_START: lambda d: f"Agent started: {d.get('agent_name', '?')}",
+    EventType.AGENT_END: _summarize_agent_end,
+    EventType.WORKSPACE_WRITE: lambda d: f"Workspace write: {d.get('field', '?')}",
+    EventType.CONSENSUS_REVIEW: _summarize_consensus_review,
+    EventType.CONSENSUS_END: _summarize_consensus_end,
+    EventType.MEMORY_COMPRESS: lambda d: f"Memory compressed: {d.get('field', '?')}",
+    EventType.ERROR: lambda d: f"Error in {d.get('source', '?')}: {str(d.get('error') or '')[:60]}",
+}
+
+
+def summarize_event(event_type: EventType | str, data: dict[str, Any]) -> str:
+    """
+    Generate a one-line human-readable summary of an event.
+
+    Accepts either an ``EventType`` or its string value, so exported event
+    dicts can be summarized without rebuilding ``Event`` objects. Returns an
+    empty summary if the payload cannot be formatted, so recording an event
+    never fails on its summary.
+    """
+    fn = _SUMMARY_FNS.get(event_type)
+    if fn is None:
+        return event_type.value if isinstance(event_type, EventType) else str(event_type)
+    try:
+        return fn(data)
+    except Exception:
+        logger.debug("Could not summarize %s event", event_type, exc_info=True)
+        return ""
@@ -12,14 +12,31 @@ Configuration hierarchy (highest to lowest priority):
 
 from __future__ import annotations
 
+import functools
+import importlib
 import logging
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger("mals.config")
 
+# PyYAML module once imported; False if it is not installed.
+_yaml: Any = None
+
+# Environment overrides as (variable, section, field, converter).
+_ENV_MAP: tuple[tuple[str, str, str, Any], ...] = (
+    ("MALS_LLM_MODEL", "llm", "model", str),
+    ("MALS_CONDUCTOR_MODEL", "llm", "conductor_model", str),
+    ("OPENAI_API_KEY", "llm", "api_key", str),
+    ("OPENAI_BASE_URL", "llm", "base_url", str),
+    ("MALS_BLACKBOARD_BACKEND", "blackboard", "backend", str),
+    ("MALS_REDIS_URL", "blackboard", "redis_url", str),
+    ("MALS_MAX_STEPS", "conductor", "max_steps", int),
+    ("MALS_LOG_LEVEL", "logging", "level", str),
+)
+
 
 @dataclass
 class LLMConfig:
@@ -44,6 +61,9 @@ class ConductorConfig:
     """Configuration for the Conductor Agent."""
     max_steps: int = 50
     consensus_max_iterations: int = 3
+    # Longer string workspace values reach agents as a head/tail excerpt;
+    # None passes every value in full
+    context_chars_per_field: int | None = 4000
 
 
 @dataclass
@@ -91,72 +111,56 @@ class MALSConfig:
         return config
 
 
+# Fields accepted from each YAML section; unknown keys are ignored.
+_SECTION_FIELDS: dict[str, frozenset[str]] = {
+    f.name: frozenset(sub.name for sub in fields(f.default_factory))
+    for f in fields(MALSConfig)
+}
+
+
+def _get_yaml() -> Any:
+    """Return the PyYAML module, importing it on first use (None if missing)."""
+    global _yaml
+    if _yaml is None:
+        try:
+            _yaml = importlib.import_module("yaml")
+        except ImportError:
+            _yaml = False
+    return _yaml or None
+
+
+@functools.lru_cache(maxsize=4)
+def _read_yaml(path: str, mtime_ns: int) -> dict[str, Any]:
+    """
+    Parse a YAML file. Cached per (path, mtime) so an edited file is re-read.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
+    with open(path) as f:
+        return _yaml.safe_load(f) or {}
+
+
 def _load_yaml(path: Path, config: MALSConfig) -> MALSConfig:
     """Load configuration from a YAML file."""
-    try:
-        import yaml
-    except ImportError:
+    if _get_yaml() is None:
         logger.warning("PyYAML not installed. Skipping YAML config file.")
         return config
 
-    with open(path) as f:
-        data = yaml.safe_load(f) or {}
-
-    # LLM config
-    llm_data = data.get("llm", {})
-    if llm_data:
-        config.llm.model = llm_data.get("model", config.llm.model)
-        config.llm.conductor_model = llm_data.get("conductor_model", config.llm.conductor_model)
-        config.llm.api_key = llm_data.get("api_key", config.llm.api_key)
-        config.llm.base_url = llm_data.get("base_url", config.llm.base_url)
-        config.llm.temperature = llm_data.get("temperature", config.llm.temperature)
-
-    # Blackboard config
-    bb_data = data.get("blackboard", {})
-    if bb_data:
-        config.blackboard.backend = bb_data.get("backend", config.blackboard.backend)
-        config.blackboard.redis_url = bb_data.get("redis_url", config.blackboard.redis_url)
-
-    # Conductor config
-    cond_data = data.get("conductor", {})
-    if cond_data:
-        config.conductor.max_steps = cond_data.get("max_steps", config.conductor.max_steps)
-        config.conductor.consensus_max_iterations = cond_data.get(
-            "consensus_max_iterations", config.conductor.consensus_max_iterations
-        )
-
-    # Logging config
-    log_data = data.get("logging", {})
-    if log_data:
-        config.logging.level = log_data.get("level", config.logging.level)
+    data = _read_yaml(str(path.resolve()), path.stat().st_mtime_ns)
+
+    for section, names in _SECTION_FIELDS.items():
+        section_data = data.get(section)
+        if section_data:
+            values = {k: v for k, v in section_data.items() if k in names}
+            setattr(config, section, replace(getattr(config, section), **values))
 
     return config
 
 
 def _apply_env_overrides(config: MALSConfig) -> MALSConfig:
     """Override configuration with environment variables."""
-    # LLM
-    if val := os.environ.get("MALS_LLM_MODEL"):
-        config.llm.model = val
-    if val := os.environ.get("MALS_CONDUCTOR_MODEL"):
-        config.llm.conductor_model = val
-    if val := os.environ.get("OPENAI_API_KEY"):
-        config.llm.api_key = val
-    if val := os.environ.get("OPENAI_BASE_URL"):
-        config.llm.base_url = val
-
-    # Blackboard
-    if val := os.environ.get("MALS_BLACKBOARD_BACKEND"):
-        config.blackboard.backend = val
-    if val := os.environ.get("MALS_REDIS_URL"):
-        config.blackboard.redis_url = val
-
-    # Conductor
-    if val := os.environ.get("MALS_MAX_STEPS"):
-        config.conductor.max_steps = int(val)
-
-    # Logging
-    if val := os.environ.get("MALS_LOG_LEVEL"):
-        config.logging.level = val
-
+    env = os.environ
+    for var, section, name, convert in _ENV_MAP:
+        if val := env.get(var):
+            setattr(getattr(config, section), name, convert(val))
     return config
@@ -3,44 +3,112 @@ Logging setup for MALS.
 
 Provides a rich, colorful console output for the Conductor loop,
 making it easy to follow the multi-agent collaboration in real-time.
+
+Records are handed to a ``QueueHandler`` and rendered by a ``QueueListener``
+on a background thread, so coroutines on the event loop only pay for an
+enqueue instead of Rich formatting and terminal I/O.
 """
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
-import sys
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class _LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler that merges the message but leaves rendering to the listener.
+
+    Like the stock ``prepare()``, ``msg % args`` is resolved on the logging
+    thread, since the args may be mutable objects that change, or are not
+    safe to read, by the time the listener gets to them. Unlike it, the
+    record is not run through a formatter and keeps ``exc_info``: the
+    listener runs in the same process, so RichHandler can still render
+    tracebacks and apply its own formatting.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
 
-from rich.console import Console
-from rich.logging import RichHandler
+# The active listener thread and the root handler feeding it.
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+# The Rich console handler, built once: creating a Console probes the terminal.
+_rich_handler: logging.Handler | None = None
 
 
 def setup_logging(level: str = "INFO") -> None:
     """
     Configure logging for the MALS system.
 
-    Uses Rich for colorful, structured console output.
+    Uses Rich for colorful, structured console output. Formatting and I/O
+    happen on a background listener thread; the root logger only enqueues.
+    Repeated calls only adjust the level while that setup is still in place.
 
     Args:
         level: The logging level (DEBUG, INFO, WARNING, ERROR).
     """
-    console = Console(stderr=True)
-
-    handler = RichHandler(
-        console=console,
-        show_time=True,
-        show_path=False,
-        markup=True,
-        rich_tracebacks=True,
-    )
-
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format="%(message)s",
-        handlers=[handler],
-        force=True,
-    )
+    global _listener, _queue_handler
+
+    log_level = getattr(logging, level.upper(), logging.INFO)
+    root = logging.getLogger()
+    if _listener is not None and _queue_handler in root.handlers:
+        root.setLevel(log_level)
+        return
+
+    # Stop the previous listener so its queue is drained before re-configuring
+    if _listener is not None:
+        _listener.stop()
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, _get_rich_handler(), respect_handler_level=True)
+    _queue_handler = _LocalQueueHandler(log_queue)
+
+    # Installed by hand rather than with basicConfig(), which would give the
+    # queue handler a formatter; RichHandler does all formatting
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(_queue_handler)
+    root.setLevel(log_level)
+    _listener.start()
 
     # Suppress noisy third-party loggers
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("openai").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
+
+
+def _get_rich_handler() -> logging.Handler:
+    """Return the shared RichHandler, importing Rich on first use."""
+    global _rich_handler
+    if _rich_handler is None:
+        from rich.console import Console
+        from rich.logging import RichHandler
+
+        _rich_handler = RichHandler(
+            console=Console(stderr=True),
+            show_time=True,
+            show_path=False,
+            markup=True,
+            rich_tracebacks=True,
+        )
+    return _rich_handler
+
+
+def _stop_listener() -> None:
+    """Flush and stop the background listener at interpreter exit."""
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
@@ -0,0 +1,55 @@
+"""
+JSON serialization helpers for MALS.
+
+Uses orjson when it is installed (``pip install mals[fast]``) and falls back
+to the standard library otherwise. Both paths return the same types:
+``dumps`` always produces UTF-8 bytes and ``loads`` accepts bytes or str.
+Dataclass instances are encoded as objects of their fields on both paths.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes.
+
+    Args:
+        obj: The object to serialize. Non-string dict keys are allowed.
+        indent: Pretty-print with a 2-space indent (for files meant to be read).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=_default).encode("utf-8")
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+def _default(obj: Any) -> Any:
+    """Stdlib fallback for types orjson encodes natively (dataclasses)."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -34,6 +34,27 @@ class TestBlackboard:
     def test_workspace_read_nonexistent(self) -> None:
         assert self.board.read_workspace("nonexistent") is None
 
+    def test_workspace_text_cached_until_rewrite(self) -> None:
+        self.board.write_workspace("plan", {"steps": [1, 2]})
+        first = self.board.state.workspace_text("plan")
+        assert first == '{"steps": [1, 2]}'
+        assert self.board.state.workspace_text("plan") is first
+
+        self.board.write_workspace("plan", {"steps": [3]})
+        assert self.board.state.workspace_text("plan") == '{"steps": [3]}'
+
+    def test_workspace_text_sees_in_place_mutation(self) -> None:
+        self.board.write_workspace("plan", {"steps": [1]})
+        assert self.board.state.workspace_text("plan") == '{"steps": [1]}'
+
+        self.board.read_workspace("plan")["steps"].append(2)
+        self.board.write_workspace("notes", "unrelated write")
+        assert self.board.state.workspace_text("plan") == '{"steps": [1, 2]}'
+
+        self.board.read_workspace("plan")["steps"].append(3)
+        self.board.state.touch()
+        assert self.board.state.workspace_text("plan") == '{"steps": [1, 2, 3]}'
+
     def test_hypothesis_lifecycle(self) -> None:
         h = self.board.propose_hypothesis("X might be the cause", "debugger")
         assert h.status == HypothesisStatus.PROPOSED
@@ -43,6 +64,12 @@ class TestBlackboard:
         assert found.status == HypothesisStatus.VALIDATED
         assert "Confirmed by test" in found.evidence
 
+    def test_hypothesis_is_validated(self) -> None:
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            self.board.propose_hypothesis(["not", "a", "string"], "debugger")  # type: ignore[arg-type]
+
     def test_hypothesis_not_found(self) -> None:
         with pytest.raises(ValueError, match="not found"):
             self.board.resolve_hypothesis("nonexistent", HypothesisStatus.REJECTED)
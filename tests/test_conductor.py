@@ -0,0 +1,97 @@
+"""Tests for the Conductor loop."""
+
+import asyncio
+import json
+
+from mals.agents.registry import AgentRegistry, AgentSpec
+from mals.core.blackboard import Blackboard, InMemoryBackend
+from mals.core.conductor import Conductor
+from mals.core.models import ConsensusState, GlobalStatus
+from mals.llm.client import LLMResponse
+from mals.memory.manager import MemoryManager
+from mals.observability.metrics import MetricsCollector
+
+
+class _ScriptedLLM:
+    """Fake LLM client that answers each Think call with the next scripted reply."""
+
+    def __init__(self, *replies: LLMResponse) -> None:
+        self._replies = list(replies)
+
+    async def complete_with_usage(self, **kwargs) -> LLMResponse:
+        return self._replies.pop(0)
+
+
+def _conductor(llm: _ScriptedLLM, registry: AgentRegistry | None = None, **kwargs) -> Conductor:
+    board = Blackboard(backend=InMemoryBackend())
+    board.initialize("Test objective")
+    return Conductor(
+        blackboard=board,
+        llm_client=llm,
+        memory_manager=MemoryManager(llm_client=None),
+        agent_registry=registry or AgentRegistry(),
+        metrics=MetricsCollector(),
+        **kwargs,
+    )
+
+
+class TestThink:
+    def test_unparseable_reply_still_counts_tokens(self) -> None:
+        llm = _ScriptedLLM(LLMResponse(content="not json", input_tokens=20, output_tokens=5))
+        conductor = _conductor(llm, max_steps=1)
+
+        assert asyncio.run(conductor.run()) == GlobalStatus.FAILED
+        assert conductor._metrics.token_usage()["conductor"] == {"input": 20, "output": 5}
+
+
+def _invoke(agent_name: str, *fields: str, include_consensus: bool = False) -> LLMResponse:
+    return LLMResponse(content=json.dumps({
+        "action": "invoke_agent",
+        "agent_name": agent_name,
+        "relevant_fields": list(fields),
+        "include_consensus": include_consensus,
+        "reason": "",
+    }))
+
+
+class TestAgentContext:
+    def _context_seen_by(
+        self, agent_name: str, reply: LLMResponse, under_review: bool = False, **kwargs
+    ) -> dict:
+        """Run one step that invokes `agent_name` and return the context it received."""
+        seen: list[dict] = []
+
+        async def execute(context, board):
+            seen.append(context)
+            return {}
+
+        registry = AgentRegistry()
+        registry.register(AgentSpec(name=agent_name, description="Test agent", execute=execute))
+        conductor = _conductor(_ScriptedLLM(reply), registry, max_steps=1, **kwargs)
+        self.board = conductor._board
+        self.board.write_workspace("draft", "a" * 6000 + "b" * 6000)
+        self.board.write_workspace(
+            "plan", {"steps": [{"title": "Draft", "output_field": "draft", "notes": "n" * 6000}]}
+        )
+        if under_review:
+            self.board.state.consensus = ConsensusState(target_field="draft")
+        asyncio.run(conductor.run())
+        return seen[0]["workspace"]
+
+    def test_large_strings_are_trimmed(self) -> None:
+        workspace = self._context_seen_by(
+            "writer", _invoke("writer", "draft", "plan"), context_chars_per_field=1000
+        )
+        assert len(workspace["draft"]) < 1100
+        assert workspace["draft"].startswith("a" * 500)
+        assert workspace["draft"].endswith("b" * 500)
+        assert workspace["plan"] is self.board.state.workspace["plan"]
+
+    def test_review_target_is_passed_whole(self) -> None:
+        workspace = self._context_seen_by(
+            "critic",
+            _invoke("critic", "draft", include_consensus=True),
+            under_review=True,
+            context_chars_per_field=1000,
+        )
+        assert workspace["draft"] == self.board.state.workspace["draft"]
@@ -0,0 +1,47 @@
+"""Tests for configuration loading."""
+
+import os
+
+import pytest
+
+from mals.utils.config import MALSConfig
+
+pytest.importorskip("yaml")
+
+
+class TestMALSConfig:
+    def test_yaml_then_env(self, tmp_path, monkeypatch) -> None:
+        path = tmp_path / "mals.yaml"
+        path.write_text("llm:\n  model: yaml-model\nconductor:\n  max_steps: 7\n")
+        monkeypatch.setenv("MALS_MAX_STEPS", "12")
+
+        config = MALSConfig.load(path)
+        assert config.llm.model == "yaml-model"
+        assert config.conductor.max_steps == 12
+
+    def test_repeated_loads_are_independent(self, tmp_path) -> None:
+        path = tmp_path / "mals.yaml"
+        path.write_text("llm:\n  model: yaml-model\n")
+
+        first = MALSConfig.load(path)
+        first.llm.model = "mutated"
+        assert MALSConfig.load(path).llm.model == "yaml-model"
+
+    def test_edited_file_is_reread(self, tmp_path) -> None:
+        path = tmp_path / "mals.yaml"
+        path.write_text("llm:\n  model: before\n")
+        assert MALSConfig.load(path).llm.model == "before"
+
+        path.write_text("llm:\n  model: after\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert MALSConfig.load(path).llm.model == "after"
+
+    def test_yaml_sections_accept_any_field(self, tmp_path) -> None:
+        path = tmp_path / "mals.yaml"
+        path.write_text("llm:\n  max_retries: 5\n  unknown: 1\nlogging:\n  format: '%(message)s'\n")
+
+        config = MALSConfig.load(path)
+        assert config.llm.max_retries == 5
+        assert not hasattr(config.llm, "unknown")
+        assert config.logging.format == "%(message)s"
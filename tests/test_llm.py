@@ -0,0 +1,130 @@
+"""Tests for the LLM client's structured-output handling."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from mals.llm import client as client_module
+from mals.llm.client import LLMClient, LLMUsage, parse_json_content
+
+
+class _RejectingCompletions:
+    """Fake `chat.completions` that rejects json_schema like a non-supporting provider."""
+
+    def __init__(self) -> None:
+        self.formats: list[dict] = []
+
+    async def create(self, **request):
+        fmt = request.get("response_format")
+        self.formats.append(fmt)
+        if fmt and fmt["type"] == "json_schema":
+            raise _BadRequestError(
+                "Invalid parameter: 'response_format' of type 'json_schema' is not supported"
+            )
+        message = SimpleNamespace(content='{"action": "complete"}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+class _BadRequestError(Exception):
+    status_code = 400
+
+
+def _client_with(completions: _RejectingCompletions) -> LLMClient:
+    client = LLMClient(model="test-model", api_key="test-key")
+    client._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return client
+
+
+class TestCompleteJson:
+    def test_falls_back_to_json_object(self) -> None:
+        completions = _RejectingCompletions()
+        client = _client_with(completions)
+
+        schema = {"type": "object", "properties": {"action": {"type": "string"}}}
+
+        async def scenario() -> None:
+            result = await client.complete_json("sys", "user", schema=schema)
+            assert result == {"action": "complete"}
+            assert [f["type"] for f in completions.formats] == ["json_schema", "json_object"]
+
+            # Later calls go straight to json_object
+            await client.complete_json("sys", "user", schema=schema)
+            assert completions.formats[-1]["type"] == "json_object"
+
+        asyncio.run(scenario())
+
+    def test_other_bad_requests_are_raised(self) -> None:
+        completions = _RejectingCompletions()
+        client = _client_with(completions)
+
+        async def create(**request):
+            completions.formats.append(request.get("response_format"))
+            raise _BadRequestError("This model's maximum context length is 8192 tokens")
+
+        completions.create = create
+        with pytest.raises(_BadRequestError):
+            asyncio.run(client.complete_json("sys", "user", schema={}))
+        assert [f["type"] for f in completions.formats] == ["json_schema"]
+        assert client._supports_json_schema
+
+    def test_parse_json_content_strips_fences(self) -> None:
+        assert parse_json_content('```json\n{"a": 1}\n```') == {"a": 1}
+
+
+@pytest.fixture
+def fresh_client_cache(monkeypatch):
+    """Give the test its own process-wide client cache."""
+    monkeypatch.setattr(client_module, "_CLIENTS", {})
+
+
+class TestClientReuse:
+    def test_get_or_create_returns_shared_client(self, fresh_client_cache) -> None:
+        a = LLMClient.get_or_create(model="shared-model", api_key="test-key")
+        b = LLMClient.get_or_create(model="shared-model", api_key="test-key")
+        c = LLMClient.get_or_create(model="shared-model", api_key="test-key", temperature=0.1)
+        assert a is b
+        assert a is not c
+        assert len(client_module._CLIENTS) == 2
+
+    def test_new_event_loop_rebuilds_and_closes_http_client(self) -> None:
+        client = _client_with(_RejectingCompletions())
+        first = client._client
+        closed: list[object] = []
+
+        async def close() -> None:
+            closed.append(first)
+
+        first.close = close
+        client._client_cls = lambda **kwargs: SimpleNamespace(
+            chat=SimpleNamespace(completions=_RejectingCompletions())
+        )
+
+        async def same_loop_twice() -> tuple[object, object]:
+            return await client._client_for_running_loop(), await client._client_for_running_loop()
+
+        a, b = asyncio.run(same_loop_twice())
+        assert a is b is first
+        assert closed == []
+
+        c = asyncio.run(client._client_for_running_loop())
+        assert c is not first
+        assert client._client is c
+        assert closed == [first]
+
+
+class TestUsage:
+    def test_complete_json_with_usage(self) -> None:
+        completions = _RejectingCompletions()
+        client = _client_with(completions)
+        usage = SimpleNamespace(prompt_tokens=11, completion_tokens=4, total_tokens=15)
+
+        async def create(**request):
+            message = SimpleNamespace(content='{"action": "complete"}')
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+        completions.create = create
+        data, resp = asyncio.run(client.complete_json_with_usage("sys", "user", schema={}))
+        assert data == {"action": "complete"}
+        assert (resp.input_tokens, resp.output_tokens, resp.total_tokens) == (11, 4, 15)
+        assert client.total_usage == LLMUsage(11, 4, 15)
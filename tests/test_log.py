@@ -0,0 +1,38 @@
+"""Tests for the logging setup."""
+
+import logging
+import queue
+import sys
+
+from mals.utils.log import _LocalQueueHandler
+
+
+class TestLocalQueueHandler:
+    def test_merges_message_and_keeps_exc_info(self) -> None:
+        q: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        handler = _LocalQueueHandler(q)
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            record = logging.LogRecord(
+                "mals", logging.ERROR, __file__, 1, "boom [%s]", ("x",), sys.exc_info()
+            )
+        handler.emit(record)
+
+        queued = q.get_nowait()
+        assert queued is not record
+        assert queued.exc_info is record.exc_info
+        assert queued.msg == "boom [x]"
+        assert queued.args is None
+        assert record.msg == "boom [%s]"
+        assert handler.formatter is None
+
+    def test_args_are_read_on_the_logging_thread(self) -> None:
+        q: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        handler = _LocalQueueHandler(q)
+        steps = ["plan"]
+        record = logging.LogRecord("mals", logging.INFO, __file__, 1, "steps=%s", (steps,), None)
+        handler.emit(record)
+        steps.append("draft")
+
+        assert q.get_nowait().getMessage() == "steps=['plan']"
@@ -46,6 +46,41 @@ class TestMemoryManager:
         ctx = self.mm.slice_context(self.state, relevant_fields=["old_code"])
         assert "old_code_summary" in ctx["workspace"]
 
+    def test_slice_context_passes_full_values_by_default(self) -> None:
+        self.state.workspace["code"] = "x" * 5000
+        self.state.memory.warm["code"] = "Summary of code"
+        ctx = self.mm.slice_context(self.state, relevant_fields=["code"])
+        assert ctx["workspace"] == {"code": "x" * 5000}
+
+    def test_slice_context_elides_oversized_strings(self) -> None:
+        self.state.workspace["log"] = "a" * 3000 + "b" * 3000
+        plan = {"steps": ["s" * 3000]}
+        self.state.workspace["plan"] = plan
+        ctx = self.mm.slice_context(
+            self.state, relevant_fields=["log", "plan"], max_chars_per_field=1000
+        )
+        excerpt = ctx["workspace"]["log"]
+        assert excerpt.startswith("a" * 500)
+        assert excerpt.endswith("b" * 500)
+        assert "5000 chars elided" in excerpt
+        # Structured values are never elided, whatever their size
+        assert ctx["workspace"]["plan"] is plan
+
+    def test_slice_context_adds_warm_summary(self) -> None:
+        self.state.workspace["code"] = "print('hi')"
+        self.state.memory.warm["code"] = "Summary of code"
+        ctx = self.mm.slice_context(self.state, relevant_fields=["code"], include_summaries=True)
+        assert ctx["workspace"] == {"code": "print('hi')", "code_summary": "Summary of code"}
+
+    def test_slice_context_keeps_review_target_whole(self) -> None:
+        from mals.core.models import ConsensusState
+        self.state.workspace["code"] = "x" * 5000
+        self.state.consensus = ConsensusState(target_field="code")
+        ctx = self.mm.slice_context(
+            self.state, relevant_fields=["code"], include_consensus=True, max_chars_per_field=1000
+        )
+        assert ctx["workspace"]["code"] == "x" * 5000
+
     def test_slice_context_with_hypotheses(self) -> None:
         from mals.core.models import Hypothesis
         self.state.hypothesis_thread.append(
@@ -48,6 +48,14 @@ class TestBlackboardState:
         assert restored.workspace["code"] == "print('hello')"
         assert restored.active_constraints == ["no deps"]
 
+    def test_to_wire_roundtrip(self) -> None:
+        state = BlackboardState(objective="Wire task", workspace={"plan": {"steps": []}})
+        wire = state.to_wire()
+        assert isinstance(wire, bytes)
+        assert wire == state.model_dump_json().encode("utf-8")
+        restored = BlackboardState.model_validate_json(wire)
+        assert restored.workspace == {"plan": {"steps": []}}
+
 
 class TestHypothesis:
     def test_default_status(self) -> None:
@@ -6,6 +6,7 @@ from pathlib import Path
 
 import pytest
 
+from mals.observability import metrics as metrics_module
 from mals.observability.metrics import MetricsCollector
 from mals.observability.recorder import EventRecorder, EventType, Event
 
@@ -38,6 +39,9 @@ class TestMetricsCollector:
         assert mc._conductor.total_input_tokens == 100
         assert mc._conductor.total_output_tokens == 50
 
+        mc.record_conductor_step("finish", latency=1.5)
+        assert mc._conductor.avg_latency == 1.0
+
     def test_record_agent_invocation_success(self):
         mc = MetricsCollector()
         mc.record_agent_invocation(
@@ -51,7 +55,7 @@ class TestMetricsCollector:
         m = mc._agent_metrics["code_generator"]
         assert m.invocation_count == 1
         assert m.success_count == 1
-        assert m.latencies == [2.5]
+        assert list(m.latencies) == [2.5]
 
     def test_record_agent_invocation_failure(self):
         mc = MetricsCollector()
@@ -85,6 +89,10 @@ class TestMetricsCollector:
         assert mc._status_transitions[0]["from"] == "PLANNING"
         assert mc._status_transitions[0]["to"] == "EXECUTING"
 
+        data = mc.to_dict()
+        assert data["task_summary"]["status_transitions"] == 1
+        assert data["status_history"][0]["reason"] == "First agent invoked"
+
     def test_to_dict_structure(self):
         mc = MetricsCollector()
         mc.record_conductor_step("invoke_agent", "planner", 0.5, 100, 50)
@@ -120,6 +128,59 @@ class TestMetricsCollector:
         assert planner["total_output_tokens"] == 370
         assert abs(planner["avg_latency_s"] - 1.5) < 0.01
 
+    def test_token_usage(self):
+        mc = MetricsCollector()
+        mc.record_conductor_step("invoke_agent", "planner", 0.5, 100, 50)
+        mc.record_agent_invocation("planner", 1.0, 200, 80)
+        mc.record_agent_invocation("critic", 1.0, 20, 10)
+        assert mc.token_usage() == {
+            "conductor": {"input": 100, "output": 50},
+            "agents": {"input": 220, "output": 90},
+            "total": 460,
+        }
+
+    def test_latency_accumulators(self):
+        mc = MetricsCollector()
+        for latency in (3.0, 1.0, 2.0):
+            mc.record_agent_invocation("planner", latency)
+
+        m = mc._agent_metrics["planner"]
+        assert m.latency_sum == 6.0
+        assert m.min_latency == 1.0
+        assert m.max_latency == 3.0
+        assert m.avg_latency == 2.0
+        assert m.latency_stats() == (2.0, 3.0, 1.0, 3.0)
+
+    def test_latency_window_bounds_samples(self):
+        mc = MetricsCollector(latency_window=3)
+        for latency in (10.0, 1.0, 2.0, 3.0, 4.0):
+            mc.record_agent_invocation("planner", latency)
+
+        m = mc._agent_metrics["planner"]
+        assert sorted(m.latencies) == [2.0, 3.0, 4.0]
+        assert m.avg_latency == 4.0
+        assert m.max_latency == 10.0
+        assert m.p95_latency == 4.0
+
+    def test_latency_window_must_be_positive(self):
+        with pytest.raises(ValueError):
+            MetricsCollector(latency_window=0)
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_p95_latency_matches_sorted_rank(self, monkeypatch, use_numpy):
+        if not use_numpy:
+            monkeypatch.setattr(metrics_module, "np", None)
+        elif metrics_module.np is None:
+            pytest.skip("numpy not installed")
+
+        mc = MetricsCollector()
+        samples = [((i * 37) % 101) / 10 for i in range(101)]
+        for latency in samples:
+            mc.record_agent_invocation("planner", latency)
+
+        expected = sorted(samples)[int(len(samples) * 0.95)]
+        assert mc._agent_metrics["planner"].p95_latency == expected
+
     def test_consensus_stats(self):
         mc = MetricsCollector()
         mc.record_consensus_cycle(1, "approved_first_try")
@@ -131,6 +192,42 @@ class TestMetricsCollector:
         cons = data["consensus"]
         assert cons["total_cycles"] == 3
         assert abs(cons["first_try_approval_rate"] - 2 / 3) < 0.01
+        assert abs(cons["avg_iterations_per_cycle"] - 5 / 3) < 0.01
+
+    def test_to_dict_cached_until_next_record(self):
+        mc = MetricsCollector()
+        mc.record_agent_invocation("planner", 1.0, 200, 100, True)
+        mc.mark_task_complete()
+
+        encoded = mc._json_bytes()
+        assert mc._json_bytes() is encoded
+        assert mc.to_dict() == json.loads(encoded)
+
+        mc.record_agent_invocation("planner", 2.0, 200, 100, True)
+        assert mc.to_dict()["agents"]["planner"]["invocation_count"] == 2
+        assert json.loads(mc._json_bytes())["task_summary"]["total_agent_invocations"] == 2
+
+    def test_mutating_export_leaves_collector_intact(self):
+        mc = MetricsCollector()
+        mc.record_conductor_step("invoke_agent", "planner", 0.5, 100, 50)
+        mc.record_agent_invocation("planner", 1.0, 200, 100, True)
+        mc.record_status_transition("planning", "executing", "plan ready")
+        mc.mark_task_complete()
+        expected = mc.to_dict()
+        encoded = mc._json_bytes()
+        text = mc.summary_text()
+
+        snapshot = mc.to_dict()
+        snapshot["task_summary"]["total_tokens"] = -1
+        snapshot["conductor"]["decision_counts"]["invoke_agent"] = 99
+        snapshot["conductor"]["routing_counts"]["critic"] = 1
+        snapshot["agents"]["planner"]["invocation_count"] = 99
+        snapshot["status_history"].clear()
+
+        assert mc.to_dict() == expected
+        assert mc._json_bytes() == encoded
+        assert mc.summary_text() == text
+        assert "critic" not in mc._conductor.routing_counts
 
     def test_summary_text(self):
         mc = MetricsCollector()
@@ -142,6 +239,17 @@ class TestMetricsCollector:
         assert "MALS Task Metrics" in text
         assert "planner" in text
 
+    def test_summary_text_cached_until_next_record(self):
+        mc = MetricsCollector()
+        mc.record_agent_invocation("planner", 1.0, 200, 100, True)
+        mc.mark_task_complete()
+
+        text = mc.summary_text()
+        assert mc.summary_text() is text
+
+        mc.record_agent_invocation("critic", 1.0, 10, 10, True)
+        assert "critic" in mc.summary_text()
+
 
 # ============================================================================
 # EventRecorder Tests
@@ -162,6 +270,42 @@ class TestEventRecorder:
         assert event.data["objective"] == "test"
         assert rec.event_count == 1
 
+    def test_timestamps_are_wall_clock_and_ordered(self, monkeypatch):
+        import time
+
+        rec = EventRecorder()
+        first = rec.record(EventType.TASK_START)
+        assert abs(first.timestamp - time.time()) < 5
+        # A wall-clock step backwards doesn't reorder recorded events
+        monkeypatch.setattr(time, "time", lambda: 0.0)
+        second = rec.record(EventType.TASK_END)
+        assert second.timestamp >= first.timestamp
+
+    def test_summary_rendered_at_record_time(self):
+        rec = EventRecorder()
+        rec.record_status_change("PLANNING", "EXECUTING", "go")
+        event = rec.events[0]
+        assert event.summary == "Status: PLANNING → EXECUTING (go)"
+        assert rec.to_dict()["events"][0]["summary"] == event.summary
+        assert Event.from_dict(event.to_dict()) == event
+
+    def test_none_valued_payloads_are_recorded(self):
+        rec = EventRecorder()
+        rec.record(EventType.TASK_START, {"objective": None})
+        rec.record(EventType.ERROR, {"source": "agent", "error": None})
+        rec.record(EventType.AGENT_END, {"agent_name": "planner", "latency_s": None})
+        rec.record(EventType.CONSENSUS_REVIEW, {"verdict": "approve", "critique": None})
+        rec.record(EventType.AGENT_END, {"agent_name": "planner", "input_tokens": "many"})
+
+        assert rec.event_count == 5
+        assert [e.summary for e in rec.events] == [
+            "Task started: ",
+            "Error in agent: ",
+            "Agent finished: planner (?, 0 tokens)",
+            "Review by ?: approve",
+            "",
+        ]
+
     def test_set_step(self):
         rec = EventRecorder()
         rec.set_step(5)
@@ -201,6 +345,16 @@ class TestEventRecorder:
         rec.record_error("planner", "LLM timeout")
         assert rec.events[0].data["error"] == "LLM timeout"
 
+    def test_bytes_roundtrip(self):
+        rec = EventRecorder()
+        rec.record_task_start("task-456", "Test export")
+        rec.set_step(1)
+        rec.record_agent_end("planner", "completed", 1.0, 100, 50)
+
+        loaded = EventRecorder.from_bytes(rec.to_bytes())
+        assert loaded.to_dict() == rec.to_dict()
+        assert loaded._current_step == 1
+
     def test_export_and_load_json(self):
         rec = EventRecorder()
         rec.record_task_start("task-456", "Test export")
@@ -225,6 +379,125 @@ class TestEventRecorder:
             loaded = EventRecorder.load_json(path)
             assert loaded.event_count == 4
             assert loaded._task_id == "task-456"
+            assert loaded._current_step == 1
+            assert loaded.events == rec.events
+            assert [e.type for e in loaded.events_in_step(1)] == [
+                EventType.AGENT_START, EventType.AGENT_END, EventType.TASK_END,
+            ]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_to_bytes_matches_to_dict(self, monkeypatch, use_orjson):
+        from mals.utils import serialization
+
+        if not use_orjson:
+            monkeypatch.setattr(serialization, "orjson", None)
+        elif serialization.orjson is None:
+            pytest.skip("orjson not installed")
+
+        rec = EventRecorder()
+        rec.record_task_start("t1", "Test objective")
+        rec.record_agent_end("planner", "completed", 1.5, 100, 50)
+        assert json.loads(rec.to_bytes()) == rec.to_dict()
+
+    def test_export_and_load_msgpack(self):
+        pytest.importorskip("msgspec")
+        rec = EventRecorder()
+        rec.record_task_start("t1", "Test objective")
+        rec.set_step(1)
+        rec.record_agent_end("planner", "completed", 1.5, 100, 50)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "recording.msgpack"
+            rec.export_msgpack(path)
+            loaded = EventRecorder.load(path)
+
+        assert loaded.to_dict() == rec.to_dict()
+
+    def test_load_dispatches_on_suffix(self):
+        rec = EventRecorder()
+        rec.record_task_start("t1", "Test objective")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "recording.json"
+            rec.export_json(path)
+            loaded = EventRecorder.load(path)
+
+        assert loaded.to_dict() == rec.to_dict()
+
+    def test_streaming_keeps_ring_and_writes_jsonl(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "recording.jsonl"
+            rec = EventRecorder(stream_path=path, ring_size=2)
+            rec.record_task_start("t1", "Test objective")
+            for step in range(1, 4):
+                rec.set_step(step)
+                rec.record_agent_start("planner", [])
+            rec.record_task_end("COMPLETED")
+            rec.close()
+
+            assert rec.event_count == 5
+            assert [e.type for e in rec.events] == [EventType.AGENT_START, EventType.TASK_END]
+
+            loaded = EventRecorder.load(path)
+            assert loaded.event_count == 5
+            assert loaded._task_id == "t1"
+            assert loaded._objective == "Test objective"
+            assert [e.step for e in loaded.events] == [0, 1, 2, 3, 3]
+            assert len(loaded.events_by_type(EventType.AGENT_START)) == 3
+            assert [e.type for e in loaded.events_in_step(3)] == [
+                EventType.AGENT_START,
+                EventType.TASK_END,
+            ]
+            # The streaming recorder answers from its in-memory ring
+            assert len(rec.events_by_type(EventType.AGENT_START)) == 1
+
+    def test_background_writes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "recording.jsonl"
+            rec = EventRecorder(stream_path=path, background_writes=True)
+            rec.record_task_start("t1", "Test objective")
+            for step in range(1, 200):
+                rec.set_step(step)
+                rec.record_agent_start("planner", [])
+            rec.record_task_end("COMPLETED")  # flushes: waits for the writer
+            assert len(path.read_bytes().splitlines()) == 201
+            rec.close()
+            assert rec._writer is None
+
+            loaded = EventRecorder.load(path)
+            assert loaded.event_count == 201
+            assert [e.step for e in loaded.events][-3:] == [198, 199, 199]
+
+    def test_open_stream_writes_earlier_events(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "recording.jsonl"
+            rec = EventRecorder()
+            rec.record_task_start("t1", "Test objective")
+            rec.open_stream(path)
+            rec.record_task_end("COMPLETED")
+            with pytest.raises(RuntimeError):
+                rec.open_stream(path)
+            rec.close()
+
+            assert rec.event_count == 2
+            loaded = EventRecorder.load(path)
+            assert [e.type for e in loaded.events] == [EventType.TASK_START, EventType.TASK_END]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_streamed_lines_match_to_dict(self, monkeypatch, use_orjson):
+        from mals.utils import serialization
+
+        if not use_orjson:
+            monkeypatch.setattr(serialization, "orjson", None)
+        elif serialization.orjson is None:
+            pytest.skip("orjson not installed")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "recording.jsonl"
+            rec = EventRecorder(stream_path=path)
+            event = rec.record(EventType.ERROR, {"source": "planner", "error": "boom"})
+            rec.close()
+            assert json.loads(path.read_bytes()) == event.to_dict()
 
     def test_events_by_type(self):
         rec = EventRecorder()
@@ -253,6 +526,39 @@ class TestEventRecorder:
         step2 = rec.events_in_step(2)
         assert len(step2) == 1
 
+    def test_to_dict_returns_independent_event_dicts(self):
+        rec = EventRecorder()
+        rec.record_task_start("t1", "Test")
+        first = rec.to_dict()["events"]
+        first[0]["type"] = "mutated"
+        first.append({})
+
+        rec.record_task_end("COMPLETED")
+        second = rec.to_dict()["events"]
+        assert second[0] is not first[0]
+        assert [e["type"] for e in second] == ["task_start", "task_end"]
+        assert json.loads(rec.to_bytes())["events"] == second
+
+    def test_to_bytes_cached_until_next_event(self):
+        rec = EventRecorder()
+        rec.record_task_start("t1", "Test")
+        first = rec.to_bytes()
+        assert rec.to_bytes() is first
+        assert rec.to_bytes(indent=True) != first
+
+        rec.record_error("x", "boom")
+        assert json.loads(rec.to_bytes())["event_count"] == 2
+
+    def test_record_after_load_appends_to_loaded_events(self):
+        rec = EventRecorder()
+        rec.record_task_start("t1", "Test")
+        loaded = EventRecorder.from_dict(rec.to_dict())
+
+        loaded.record_error("x", "boom")
+        assert loaded.event_count == 2
+        assert [e.type for e in loaded.events] == [EventType.TASK_START, EventType.ERROR]
+        assert len(loaded.events_by_type(EventType.ERROR)) == 1
+
     def test_timeline(self):
         rec = EventRecorder()
         rec.record_task_start("t1", "Test")
@@ -265,6 +571,7 @@ class TestEventRecorder:
         assert len(tl) == 4
         assert tl[0]["type"] == "task_start"
         assert "summary" in tl[0]
+        assert tl[2]["summary"] == "Agent finished: planner (completed, 1.5s, 150 tokens)"
 
     def test_to_dict(self):
         rec = EventRecorder()
@@ -295,6 +602,31 @@ class TestEvent:
         assert event.step == 3
         assert event.data["agent_name"] == "planner"
 
+    def test_from_dict_unknown_type(self):
+        with pytest.raises(ValueError, match="not a valid EventType"):
+            Event.from_dict({"type": "bogus", "timestamp": 0.0})
+
+    def test_from_dict_fast(self):
+        event = Event(type=EventType.ERROR, timestamp=1.0, data={"error": "x"}, step=2, summary="s")
+        assert Event.from_dict_fast(event.to_dict()) == event
+        with pytest.raises(KeyError):
+            Event.from_dict_fast({"type": "error", "timestamp": 1.0})
+
+    def test_recorder_from_dict_accepts_partial_events(self):
+        data = {"task_id": "t1", "events": [{"type": "task_start", "timestamp": 1.0}]}
+        rec = EventRecorder.from_dict(data)
+        assert rec.events[0].summary == ""
+        with pytest.raises(ValueError, match="not a valid EventType"):
+            EventRecorder.from_dict({"events": [{"type": "bogus", "timestamp": 0.0}]})
+
+    def test_frozen_and_slotted(self):
+        import dataclasses
+
+        event = Event(type=EventType.TASK_START)
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.step = 5
+
 
 # ============================================================================
 # Dashboard Tests
@@ -317,6 +649,145 @@ class TestDashboard:
         assert "/api/recording" in routes
         assert "/api/timeline" in routes
 
+    def test_dashboard_endpoints_serve_json(self):
+        from fastapi.testclient import TestClient
+
+        from mals.observability.dashboard import create_dashboard_app
+
+        app = create_dashboard_app(
+            metrics_data={"task_summary": {"total_steps": 5}},
+            recording_data={"task_id": "t1", "events": [
+                {"type": "task_start", "timestamp": 1.0, "step": 0, "data": {"objective": "x"}},
+            ]},
+        )
+        client = TestClient(app)
+        metrics = client.get("/api/metrics")
+        assert metrics.headers["content-type"] == "application/json"
+        assert metrics.json() == {"task_summary": {"total_steps": 5}}
+        timeline = client.get("/api/timeline").json()
+        assert timeline[0]["type"] == "task_start"
+        assert timeline[0]["step"] == 0
+        assert timeline[0]["summary"] == "Task started: x"
+        assert "data" not in timeline[0]
+        full = client.get("/api/timeline/full").json()
+        assert full[0]["data"] == {"objective": "x"}
+
+    def test_dashboard_chart_columns(self):
+        from fastapi.testclient import TestClient
+
+        from mals.observability.dashboard import create_dashboard_app
+
+        mc = MetricsCollector()
+        mc.record_conductor_step("invoke_agent", "planner", 0.5)
+        mc.record_agent_invocation("planner", 1.0, 200, 100, True)
+        mc.record_agent_invocation("coder", 3.0, 400, 300, True)
+        mc.mark_task_complete()
+
+        client = TestClient(create_dashboard_app(metrics_data=mc.to_dict()))
+        charts = client.get("/api/charts").json()
+        assert charts["names"] == ["coder", "planner"]
+        assert charts["input_tokens"] == [400, 200]
+        assert charts["output_tokens"] == [300, 100]
+        assert charts["avg_latency_s"] == [3.0, 1.0]
+        assert charts["routing"] == {"labels": ["planner"], "counts": [1]}
+        assert charts["decisions"] == {"labels": ["invoke_agent"], "counts": [1]}
+
+    def test_dashboard_snapshot(self):
+        from fastapi.testclient import TestClient
+
+        from mals.observability.dashboard import create_dashboard_app
+
+        client = TestClient(create_dashboard_app(
+            metrics_data={"task_summary": {"total_steps": 5}},
+            recording_data={"task_id": "t1", "objective": "x", "events": [
+                {"type": "task_start", "timestamp": 1.0, "step": 0, "data": {"objective": "x"}},
+            ]},
+        ))
+        snapshot = client.get("/api/snapshot").json()
+        assert snapshot["metrics"] == client.get("/api/metrics").json()
+        assert snapshot["charts"] == client.get("/api/charts").json()
+        assert snapshot["timeline"] == client.get("/api/timeline").json()
+        assert snapshot["recording"] == {"task_id": "t1", "objective": "x", "event_count": 1}
+
+    def test_dashboard_page_etag(self):
+        from fastapi.testclient import TestClient
+
+        from mals.observability.dashboard import create_dashboard_app
+
+        client = TestClient(create_dashboard_app())
+        page = client.get("/")
+        assert page.status_code == 200
+        assert page.headers["content-type"].startswith("text/html")
+        assert "MALS Dashboard" in page.text
+
+        etag = page.headers["etag"]
+        cached = client.get("/", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+    def test_dashboard_api_conditional_get(self):
+        from fastapi.testclient import TestClient
+
+        from mals.observability.dashboard import create_dashboard_app
+
+        client = TestClient(create_dashboard_app(
+            metrics_data={"task_summary": {"total_steps": 5}},
+            recording_data={"task_id": "t1", "events": []},
+        ))
+        for path in ("/api/metrics", "/api/recording", "/api/timeline"):
+            first = client.get(path)
+            assert first.status_code == 200
+            etag = first.headers["etag"]
+            cached = client.get(path, headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.content == b""
+        metrics_etag = client.get("/api/metrics").headers["etag"]
+        assert metrics_etag != client.get("/api/recording").headers["etag"]
+
+    def test_dashboard_gzips_large_payloads(self):
+        from fastapi.testclient import TestClient
+
+        from mals.observability.dashboard import create_dashboard_app
+
+        events = [
+            {
+                "type": "agent_start",
+                "timestamp": float(i),
+                "step": i,
+                "data": {"agent_name": "planner"},
+            }
+            for i in range(100)
+        ]
+        recording = {"task_id": "t1", "events": events}
+        client = TestClient(create_dashboard_app(recording_data=recording))
+
+        compressed = client.get("/api/recording", headers={"Accept-Encoding": "gzip"})
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.json()["events"] == events
+
+        plain = client.get("/api/recording", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.json()["events"] == events
+        assert plain.headers["etag"] != compressed.headers["etag"]
+
+    def test_dashboard_recording_stream(self):
+        from fastapi.testclient import TestClient
+
+        from mals.observability.dashboard import create_dashboard_app
+
+        events = [
+            {"type": "task_start", "timestamp": 1.0, "step": 0, "data": {"objective": "x"}},
+            {"type": "task_end", "timestamp": 2.0, "step": 1, "data": {"status": "COMPLETED"}},
+        ]
+        recording = {"task_id": "t1", "events": events}
+        client = TestClient(create_dashboard_app(recording_data=recording))
+        res = client.get("/api/recording/stream")
+        assert res.headers["content-type"] == "application/x-ndjson"
+
+        lines = [json.loads(line) for line in res.text.splitlines()]
+        assert lines[0] == {"task_id": "t1", "event_count": 2}
+        assert [{k: v for k, v in line.items() if k != "summary"} for line in lines[1:]] == events
+        assert lines[1]["summary"] == "Task started: x"
+
     def test_create_dashboard_from_files(self):
         from mals.observability.dashboard import create_dashboard_app
 
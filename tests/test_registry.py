@@ -20,6 +20,9 @@ class TestAgentRegistry:
         self.registry.register(agent)
         with pytest.raises(ValueError, match="already registered"):
             self.registry.register(AgentSpec(name="dup", description="Second"))
+        with pytest.raises(ValueError, match="already registered"):
+            self.registry.register(agent)
+        assert self.registry.get("dup") is agent
 
     def test_get_nonexistent(self) -> None:
         assert self.registry.get("nonexistent") is None
@@ -47,6 +50,14 @@ class TestAgentRegistry:
         desc = self.registry.describe_all()
         assert "No agents" in desc
 
+    def test_describe_all_cached_until_register(self) -> None:
+        self.registry.register(AgentSpec(name="a", description="Agent A"))
+        desc = self.registry.describe_all()
+        assert self.registry.describe_all() is desc
+
+        self.registry.register(AgentSpec(name="b", description="Agent B"))
+        assert "Agent B" in self.registry.describe_all()
+
     def test_len_and_contains(self) -> None:
         self.registry.register(AgentSpec(name="x", description="X"))
         assert len(self.registry) == 1
@@ -0,0 +1,43 @@
+"""Tests for the JSON serialization helpers."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from mals.utils import serialization
+from mals.utils.serialization import dumps, loads
+
+
+class TestSerialization:
+    def test_roundtrip(self) -> None:
+        payload = {"task_id": "t1", "events": [{"step": 1, "data": {"text": "héllo"}}]}
+        raw = dumps(payload)
+        assert isinstance(raw, bytes)
+        assert "héllo".encode() in raw  # not ASCII-escaped
+        assert loads(raw) == payload
+        assert loads(raw.decode("utf-8")) == payload
+
+    def test_indent(self) -> None:
+        raw = dumps({"a": [1]}, indent=True)
+        assert b"\n  " in raw
+        assert loads(raw) == {"a": [1]}
+
+    def test_stdlib_fallback(self, monkeypatch) -> None:
+        monkeypatch.setattr(serialization, "orjson", None)
+        raw = dumps({"a": "é", 1: 2})
+        assert raw == '{"a":"é","1":2}'.encode()
+        assert loads(raw) == {"a": "é", "1": 2}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dataclasses(self, monkeypatch, use_orjson) -> None:
+        if not use_orjson:
+            monkeypatch.setattr(serialization, "orjson", None)
+        elif serialization.orjson is None:
+            pytest.skip("orjson not installed")
+
+        @dataclass(slots=True)
+        class Point:
+            x: int
+            tags: list[str]
+
+        assert loads(dumps([Point(1, ["a"])])) == [{"x": 1, "tags": ["a"]}]